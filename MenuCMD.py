@@ -3,260 +3,534 @@ Menu de operações via CMD para o Sistema de Fechamento de Lojas.
 CORRIGIDO: Melhor tratamento de erros e opções de debug.
 """
 
-from manager.LojaManager import LojaManager
-from manager.FirebirdManager import FirebirdManager
+import asyncio
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from logger.Logger import configurar_logging
 
 
+def _criar_loja_manager():
+    """Cria o gerenciador do Sheets importando gspread apenas no primeiro uso."""
+    from manager.LojaManager import LojaManager
+
+    return LojaManager()
+
+
+def _criar_firebird_manager():
+    """Cria o gerenciador do Firebird importando fdb apenas no primeiro uso."""
+    from manager.FirebirdManager import FirebirdManager
+
+    return FirebirdManager()
+
+
+# Banner e menu pré-montados no import: uma única escrita no stdout por
+# exibição em vez de um print (lock + flush) por linha
+_BANNER = "\n".join(
+    [
+        "=" * 60,
+        "🏪 SISTEMA DE FECHAMENTO DE LOJAS - MENU INTERATIVO",
+        "   📊 Google Sheets + 🔥 Firebird 5.0",
+        "=" * 60,
+        "",
+        "",
+    ]
+)
+
+_MENU = "\n".join(
+    [
+        "",
+        "========== MENU DE OPERAÇÕES ==========",
+        "1 - Fechar loja (Sheets + formatação)",
+        "2 - Atualizar status da loja no Firebird",
+        "3 - Verificar loja (Sheets)",
+        "4 - Verificar status loja (Firebird)",
+        "5 - Listar lojas do Firebird por status",
+        "6 - Verificar estrutura tabela TB_LOJA",
+        "7 - Estatísticas da tabela TB_LOJA",
+        "8 - Testar conexões",
+        "9 - Sair",
+        "========================================",
+        "",
+        "",
+    ]
+)
+
+
 def imprimir_banner():
     """Imprime o banner do sistema."""
-    print("=" * 60)
-    print("🏪 SISTEMA DE FECHAMENTO DE LOJAS - MENU INTERATIVO")
-    print("   📊 Google Sheets + 🔥 Firebird 5.0")
-    print("=" * 60)
-    print()
+    sys.stdout.write(_BANNER)
 
 
 def menu():
-    print("\n========== MENU DE OPERAÇÕES ==========")
-    print("1 - Fechar loja (Sheets + formatação)")
-    print("2 - Atualizar status da loja no Firebird")
-    print("3 - Verificar loja (Sheets)")
-    print("4 - Verificar status loja (Firebird)")
-    print("5 - Listar lojas do Firebird por status")
-    print("6 - Verificar estrutura tabela TB_LOJA")
-    print("7 - Estatísticas da tabela TB_LOJA")
-    print("8 - Testar conexões")
-    print("9 - Sair")
-    print("========================================\n")
-
+    sys.stdout.write(_MENU)
+
+
+async def _testar_conexoes(loja_manager, firebird_manager):
+    """
+    Testa as conexões Google Sheets e Firebird em paralelo.
+
+    Os dois handshakes são independentes e limitados por I/O, então rodam em
+    threads do executor e o tempo total é o do mais lento, não a soma.
+    """
+
+    def testar_sheets():
+        try:
+            if loja_manager.assegurar_conexao():
+                if loja_manager.validar_conexao():
+                    return "   ✅ Google Sheets conectado com sucesso"
+                return "   ❌ Erro na validação do Google Sheets"
+            return "   ❌ Erro ao conectar no Google Sheets"
+        except Exception as e:
+            return f"   ❌ Erro inesperado: {e}"
+
+    def testar_firebird():
+        try:
+            if firebird_manager.assegurar_conexao():
+                if firebird_manager.testar_conexao():
+                    return "   ✅ Firebird conectado com sucesso"
+                return "   ❌ Erro na validação do Firebird"
+            return "   ❌ Erro ao conectar no Firebird"
+        except Exception as e:
+            return f"   ❌ Erro inesperado: {e}"
+
+    loop = asyncio.get_running_loop()
+    resultado_sheets, resultado_firebird = await asyncio.gather(
+        loop.run_in_executor(None, testar_sheets),
+        loop.run_in_executor(None, testar_firebird),
+    )
+
+    print("📊 Google Sheets:")
+    print(resultado_sheets)
+    print("🔥 Firebird:")
+    print(resultado_firebird)
+
+
+def _executar_operacao_batch(
+    loja_manager,
+    firebird_manager,
+    trava_sheets,
+    trava_firebird,
+    operacao,
+    argumentos,
+):
+    """
+    Executa uma operação do modo batch e retorna a linha de resultado.
+
+    Cada gerenciador compartilhado é acessado sob a trava do seu backend:
+    o fdb (threadsafety 1) não admite cursor nem conexão compartilhados
+    entre threads, e os caches de sessão do Sheets também não são
+    thread-safe. As travas são por backend, então operações de Sheets e
+    de Firebird ainda se sobrepõem.
+
+    Args:
+        loja_manager (LojaManager): Gerenciador compartilhado do Sheets.
+        firebird_manager (FirebirdManager): Gerenciador compartilhado do Firebird.
+        trava_sheets (threading.Lock): Trava que serializa o acesso ao Sheets.
+        trava_firebird (threading.Lock): Trava que serializa o acesso ao Firebird.
+        operacao (str): Código da operação (mesma numeração do menu: 1-4).
+        argumentos (list): Argumentos da operação.
+
+    Returns:
+        str: Linha de resultado formatada.
+    """
+    try:
+        if operacao == "1":
+            numero_loja = argumentos[0]
+            obs = argumentos[1] if len(argumentos) > 1 else None
+            with trava_sheets:
+                if not loja_manager.assegurar_conexao():
+                    return (
+                        f"❌ [1] Loja {numero_loja}: erro ao conectar no Google Sheets"
+                    )
+                resultado = loja_manager.fechar_loja(numero_loja, obs)
+            icone = "✅" if resultado.sucesso else "❌"
+            return f"{icone} [1] {resultado.mensagem}"
+
+        if operacao == "2":
+            codigo_loja = argumentos[0]
+            status = (
+                int(argumentos[1])
+                if len(argumentos) > 1 and argumentos[1].isdigit()
+                else 3
+            )
+            with trava_firebird:
+                if not firebird_manager.assegurar_conexao():
+                    return f"❌ [2] Loja {codigo_loja}: erro ao conectar no Firebird"
+                atualizado = firebird_manager.atualizar_status_loja(
+                    codigo_loja, status
+                )
+            if atualizado:
+                return f"✅ [2] Loja {codigo_loja} atualizada para ID_STATUS={status}"
+            return f"❌ [2] Erro ao atualizar loja {codigo_loja}"
+
+        if operacao == "3":
+            numero_loja = argumentos[0]
+            with trava_sheets:
+                if not loja_manager.assegurar_conexao():
+                    return (
+                        f"❌ [3] Loja {numero_loja}: erro ao conectar no Google Sheets"
+                    )
+                info = loja_manager.obter_informacoes_loja(numero_loja)
+            if info:
+                return (
+                    f"✅ [3] Loja {numero_loja}: {info['nome_loja']} "
+                    f"(linha {info['linha_gerenciador']})"
+                )
+            return f"❌ [3] Loja {numero_loja} não encontrada"
+
+        if operacao == "4":
+            codigo_loja = argumentos[0]
+            with trava_firebird:
+                if not firebird_manager.assegurar_conexao():
+                    return f"❌ [4] Loja {codigo_loja}: erro ao conectar no Firebird"
+                loja_info = firebird_manager.buscar_loja_por_codigo(codigo_loja)
+            if loja_info:
+                return (
+                    f"✅ [4] Loja {loja_info.codigo_loja}: "
+                    f"status {loja_info.id_status}"
+                )
+            return f"❌ [4] Loja {codigo_loja} não encontrada"
+
+        return f"❌ Operação inválida no batch: {operacao}"
+
+    except IndexError:
+        return f"❌ Argumentos insuficientes para a operação {operacao}"
+    except Exception as e:
+        return f"❌ Erro inesperado na operação {operacao}: {e}"
+
+
+def executar_batch(caminho_arquivo):
+    """
+    Executa operações em lote a partir de um arquivo CSV (opcao,args...).
+
+    As linhas rodam em um pool de threads compartilhando os mesmos
+    gerenciadores, com uma trava por backend: operações de Sheets e de
+    Firebird se sobrepõem entre si, mas cada backend é acessado por uma
+    thread de cada vez (o cursor persistente do fdb e os caches de sessão
+    não suportam acesso concorrente).
+
+    Args:
+        caminho_arquivo (str): Caminho do arquivo com uma operação por linha.
+
+    Returns:
+        bool: True se todas as operações tiveram sucesso, False caso contrário.
+    """
+    try:
+        with open(caminho_arquivo, "r", encoding="utf-8") as arquivo:
+            operacoes = []
+            for linha in arquivo:
+                linha = linha.strip()
+                if not linha or linha.startswith("#"):
+                    continue
+                partes = [parte.strip() for parte in linha.split(",")]
+                operacoes.append((partes[0], partes[1:]))
+    except OSError as e:
+        print(f"❌ Erro ao ler arquivo de batch {caminho_arquivo}: {e}")
+        return False
+
+    if not operacoes:
+        print("❌ Nenhuma operação encontrada no arquivo de batch")
+        return False
+
+    loja_manager = _criar_loja_manager()
+    firebird_manager = _criar_firebird_manager()
+
+    print(f"📋 Executando {len(operacoes)} operações em lote...")
+
+    # Uma trava por backend: serializa o uso de cada gerenciador
+    # compartilhado sem impedir a sobreposição Sheets × Firebird
+    trava_sheets = threading.Lock()
+    trava_firebird = threading.Lock()
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            resultados = list(
+                executor.map(
+                    lambda op: _executar_operacao_batch(
+                        loja_manager,
+                        firebird_manager,
+                        trava_sheets,
+                        trava_firebird,
+                        op[0],
+                        op[1],
+                    ),
+                    operacoes,
+                )
+            )
+    finally:
+        loja_manager.desconectar()
+        firebird_manager.desconectar()
+
+    sys.stdout.write("\n".join(resultados) + "\n")
+
+    sucessos = sum(1 for resultado in resultados if resultado.startswith("✅"))
+    print(f"\n📊 Resumo: {sucessos}/{len(resultados)} operações com sucesso")
+    return sucessos == len(resultados)
+
+
+def _opcao_fechar_loja(obter_loja_manager, obter_firebird_manager):
+    """Opção 1: fecha uma loja no Google Sheets."""
+    print("\n🏪 FECHAMENTO DE LOJA (SHEETS)")
+    numero_loja = input("Digite o número da loja: ").strip()
+    if not numero_loja:
+        print("❌ Número da loja não pode estar vazio!")
+        return
+
+    obs = input("Observação (opcional): ").strip()
+
+    try:
+        loja_manager = obter_loja_manager()
+        if loja_manager.assegurar_conexao():
+            resultado = loja_manager.fechar_loja(numero_loja, obs if obs else None)
+            if resultado.sucesso:
+                print(f"✅ {resultado.mensagem}")
+                if resultado.detalhes:
+                    print(f"   📅 Data: {resultado.detalhes.data_fechamento}")
+                    print(f"   📝 Observação: {resultado.detalhes.observacao}")
+            else:
+                print(f"❌ {resultado.mensagem}")
+        else:
+            print("❌ Erro ao conectar no Google Sheets")
+    except Exception as e:
+        print(f"❌ Erro inesperado: {e}")
+
+
+def _opcao_atualizar_status_firebird(obter_loja_manager, obter_firebird_manager):
+    """Opção 2: atualiza o status de uma loja no Firebird."""
+    print("\n🔥 ATUALIZAÇÃO STATUS FIREBIRD")
+    codigo_loja = input("Digite o número da loja: ").strip()
+    if not codigo_loja:
+        print("❌ Código da loja não pode estar vazio!")
+        return
+
+    status = input("Status (padrão 3): ").strip()
+    status = int(status) if status.isdigit() else 3
+
+    try:
+        firebird_manager = obter_firebird_manager()
+        if firebird_manager.assegurar_conexao():
+            if firebird_manager.atualizar_status_loja(codigo_loja, status):
+                print(f"✅ Loja {codigo_loja} atualizada para ID_STATUS={status}")
+            else:
+                print(f"❌ Erro ao atualizar loja {codigo_loja}")
+        else:
+            print("❌ Erro ao conectar no Firebird")
+    except Exception as e:
+        print(f"❌ Erro inesperado: {e}")
+
+
+def _opcao_verificar_loja(obter_loja_manager, obter_firebird_manager):
+    """Opção 3: verifica uma ou mais lojas no Google Sheets."""
+    print("\n📊 VERIFICAÇÃO LOJA (SHEETS)")
+    entrada = input(
+        "Digite o número da loja (ou vários separados por vírgula): "
+    ).strip()
+    if not entrada:
+        print("❌ Número da loja não pode estar vazio!")
+        return
+
+    numeros_lojas = [n.strip() for n in entrada.split(",") if n.strip()]
+
+    try:
+        loja_manager = obter_loja_manager()
+        if loja_manager.assegurar_conexao():
+            # Uma única leitura da planilha para todas as lojas
+            infos = loja_manager.obter_informacoes_lojas_batch(numeros_lojas)
+            for numero_loja, info in infos.items():
+                if info:
+                    print(f"✅ Loja {numero_loja} encontrada:")
+                    print(f"   🏪 Nome: {info['nome_loja']}")
+                    print(f"   📍 Número: {info['numero_loja']}")
+                    print(f"   👥 Grupo: {info['grupo']}")
+                    print(f"   📊 Status D: {info['status_d']}")
+                    print(f"   📊 Status I: {info['status_i']}")
+                    print(f"   📍 Linha: {info['linha_gerenciador']}")
+                else:
+                    print(f"❌ Loja {numero_loja} não encontrada")
+        else:
+            print("❌ Erro ao conectar no Google Sheets")
+    except Exception as e:
+        print(f"❌ Erro inesperado: {e}")
+
+
+def _opcao_verificar_status_firebird(obter_loja_manager, obter_firebird_manager):
+    """Opção 4: consulta o status de uma loja no Firebird."""
+    print("\n🔥 VERIFICAÇÃO STATUS (FIREBIRD)")
+    codigo_loja = input("Digite o número da loja: ").strip()
+    if not codigo_loja:
+        print("❌ Código da loja não pode estar vazio!")
+        return
+
+    try:
+        firebird_manager = obter_firebird_manager()
+        if firebird_manager.assegurar_conexao():
+            loja_info = firebird_manager.buscar_loja_por_codigo(codigo_loja)
+            if loja_info:
+                print("✅ Loja encontrada:")
+                print(f"   🔢 Código: {loja_info.codigo_loja}")
+                print(f"   📊 Status: {loja_info.id_status}")
+                print(f"   🏪 Nome: {loja_info.nome}")
+            else:
+                print("❌ Loja não encontrada")
+        else:
+            print("❌ Erro ao conectar no Firebird")
+    except Exception as e:
+        print(f"❌ Erro inesperado: {e}")
+
+
+def _opcao_listar_por_status(obter_loja_manager, obter_firebird_manager):
+    """Opção 5: lista as lojas do Firebird com um determinado status."""
+    print("\n📋 LISTAR LOJAS POR STATUS")
+    status_input = input("Digite o status (número): ").strip()
+    if not status_input.isdigit():
+        print("❌ Status deve ser um número!")
+        return
+
+    status = int(status_input)
+
+    try:
+        firebird_manager = obter_firebird_manager()
+        if firebird_manager.assegurar_conexao():
+            lojas = firebird_manager.listar_lojas_por_status(status)
+            if lojas:
+                print(f"✅ Encontradas {len(lojas)} lojas com status {status}:")
+                # Uma única escrita para N lojas em vez de um
+                # print (lock + flush) por linha
+                sys.stdout.write(
+                    "\n".join(
+                        f"   {i:3d}. {loja.codigo_loja} (Status: {loja.id_status})"
+                        for i, loja in enumerate(lojas, 1)
+                    )
+                    + "\n"
+                )
+            else:
+                print(f"❌ Nenhuma loja encontrada com status {status}")
+        else:
+            print("❌ Erro ao conectar no Firebird")
+    except Exception as e:
+        print(f"❌ Erro inesperado: {e}")
+
+
+def _opcao_verificar_estrutura(obter_loja_manager, obter_firebird_manager):
+    """Opção 6: verifica a estrutura da tabela TB_LOJA."""
+    print("\n🔍 VERIFICAÇÃO ESTRUTURA TABELA")
+    try:
+        firebird_manager = obter_firebird_manager()
+        if firebird_manager.assegurar_conexao():
+            if firebird_manager.verificar_estrutura_tabela():
+                print("✅ Estrutura da tabela TB_LOJA está correta")
+            else:
+                print("❌ Problemas na estrutura da tabela TB_LOJA")
+        else:
+            print("❌ Erro ao conectar no Firebird")
+    except Exception as e:
+        print(f"❌ Erro inesperado: {e}")
+
+
+def _opcao_estatisticas(obter_loja_manager, obter_firebird_manager):
+    """Opção 7: mostra estatísticas da tabela TB_LOJA."""
+    print("\n📈 ESTATÍSTICAS DA TABELA")
+    try:
+        firebird_manager = obter_firebird_manager()
+        if firebird_manager.assegurar_conexao():
+            stats = firebird_manager.obter_estatisticas_tabela()
+            if stats:
+                print("✅ Estatísticas da tabela TB_LOJA:")
+                print(f"   📊 Total de lojas: {stats['total_lojas']}")
+                print(f"   📅 Timestamp: {stats['timestamp']}")
+                print(f"   📋 Lojas por status:")
+                for status, count in stats["lojas_por_status"].items():
+                    print(f"      Status {status}: {count} lojas")
+            else:
+                print("❌ Erro ao obter estatísticas")
+        else:
+            print("❌ Erro ao conectar no Firebird")
+    except Exception as e:
+        print(f"❌ Erro inesperado: {e}")
 
-def main():
-    # Configurar logging
-    configurar_logging()
 
-    imprimir_banner()
+def _opcao_testar_conexoes(obter_loja_manager, obter_firebird_manager):
+    """Opção 8: testa as conexões em paralelo."""
+    print("\n🔌 TESTE DE CONEXÕES")
+    print("📊 Google Sheets + 🔥 Firebird (em paralelo)...")
+    asyncio.run(_testar_conexoes(obter_loja_manager(), obter_firebird_manager()))
 
-    loja_manager = LojaManager()
-    firebird_manager = FirebirdManager()
 
-    while True:
-        menu()
-        escolha = input("Escolha a opção desejada: ").strip()
+# Despacho O(1) por opção, sem varrer a cadeia de if/elif a cada iteração
+_OPCOES = {
+    "1": _opcao_fechar_loja,
+    "2": _opcao_atualizar_status_firebird,
+    "3": _opcao_verificar_loja,
+    "4": _opcao_verificar_status_firebird,
+    "5": _opcao_listar_por_status,
+    "6": _opcao_verificar_estrutura,
+    "7": _opcao_estatisticas,
+    "8": _opcao_testar_conexoes,
+}
 
-        if escolha == "1":
-            print("\n🏪 FECHAMENTO DE LOJA (SHEETS)")
-            numero_loja = input("Digite o número da loja: ").strip()
-            if not numero_loja:
-                print("❌ Número da loja não pode estar vazio!")
-                continue
 
-            obs = input("Observação (opcional): ").strip()
+def main():
+    # Aliases locais: LOAD_FAST em vez de LOAD_GLOBAL a cada volta do loop
+    _print = print
+    _input = input
 
-            try:
-                if loja_manager.conectar():
-                    resultado = loja_manager.fechar_loja(
-                        numero_loja, obs if obs else None
-                    )
-                    if resultado.sucesso:
-                        print(f"✅ {resultado.mensagem}")
-                        if resultado.detalhes:
-                            print(
-                                f"   📅 Data: {resultado.detalhes['data_fechamento']}"
-                            )
-                            print(
-                                f"   📝 Observação: {resultado.detalhes['observacao']}"
-                            )
-                    else:
-                        print(f"❌ {resultado.mensagem}")
-                else:
-                    print("❌ Erro ao conectar no Google Sheets")
-            except Exception as e:
-                print(f"❌ Erro inesperado: {e}")
-            finally:
-                loja_manager.desconectar()
-
-        elif escolha == "2":
-            print("\n🔥 ATUALIZAÇÃO STATUS FIREBIRD")
-            codigo_loja = input("Digite o número da loja: ").strip()
-            if not codigo_loja:
-                print("❌ Código da loja não pode estar vazio!")
-                continue
-
-            status = input("Status (padrão 3): ").strip()
-            status = int(status) if status.isdigit() else 3
-
-            try:
-                if firebird_manager.conectar():
-                    if firebird_manager.atualizar_status_loja(codigo_loja, status):
-                        print(
-                            f"✅ Loja {codigo_loja} atualizada para ID_STATUS={status}"
-                        )
-                    else:
-                        print(f"❌ Erro ao atualizar loja {codigo_loja}")
-                else:
-                    print("❌ Erro ao conectar no Firebird")
-            except Exception as e:
-                print(f"❌ Erro inesperado: {e}")
-            finally:
-                firebird_manager.desconectar()
-
-        elif escolha == "3":
-            print("\n📊 VERIFICAÇÃO LOJA (SHEETS)")
-            numero_loja = input("Digite o número da loja para verificar: ").strip()
-            if not numero_loja:
-                print("❌ Número da loja não pode estar vazio!")
-                continue
-
-            try:
-                if loja_manager.conectar():
-                    info = loja_manager.obter_informacoes_loja(numero_loja)
-                    if info:
-                        print("✅ Loja encontrada:")
-                        print(f"   🏪 Nome: {info['nome_loja']}")
-                        print(f"   📍 Número: {info['numero_loja']}")
-                        print(f"   👥 Grupo: {info['grupo']}")
-                        print(f"   📊 Status D: {info['status_d']}")
-                        print(f"   📊 Status I: {info['status_i']}")
-                        print(f"   📍 Linha: {info['linha_gerenciador']}")
-                    else:
-                        print("❌ Loja não encontrada")
-                else:
-                    print("❌ Erro ao conectar no Google Sheets")
-            except Exception as e:
-                print(f"❌ Erro inesperado: {e}")
-            finally:
-                loja_manager.desconectar()
-
-        elif escolha == "4":
-            print("\n🔥 VERIFICAÇÃO STATUS (FIREBIRD)")
-            codigo_loja = input("Digite o número da loja: ").strip()
-            if not codigo_loja:
-                print("❌ Código da loja não pode estar vazio!")
-                continue
-
-            try:
-                if firebird_manager.conectar():
-                    loja_info = firebird_manager.buscar_loja_por_codigo(codigo_loja)
-                    if loja_info:
-                        print("✅ Loja encontrada:")
-                        print(f"   🔢 Código: {loja_info['codigo_loja']}")
-                        print(f"   📊 Status: {loja_info['id_status']}")
-                        print(f"   🏪 Nome: {loja_info.get('nome', 'N/A')}")
-                    else:
-                        print("❌ Loja não encontrada")
-                else:
-                    print("❌ Erro ao conectar no Firebird")
-            except Exception as e:
-                print(f"❌ Erro inesperado: {e}")
-            finally:
-                firebird_manager.desconectar()
-
-        elif escolha == "5":
-            print("\n📋 LISTAR LOJAS POR STATUS")
-            status_input = input("Digite o status (número): ").strip()
-            if not status_input.isdigit():
-                print("❌ Status deve ser um número!")
-                continue
-
-            status = int(status_input)
-
-            try:
-                if firebird_manager.conectar():
-                    lojas = firebird_manager.listar_lojas_por_status(status)
-                    if lojas:
-                        print(f"✅ Encontradas {len(lojas)} lojas com status {status}:")
-                        for i, loja in enumerate(lojas, 1):
-                            print(
-                                f"   {i:3d}. {loja['codigo_loja']} (Status: {loja['id_status']})"
-                            )
-                    else:
-                        print(f"❌ Nenhuma loja encontrada com status {status}")
-                else:
-                    print("❌ Erro ao conectar no Firebird")
-            except Exception as e:
-                print(f"❌ Erro inesperado: {e}")
-            finally:
-                firebird_manager.desconectar()
-
-        elif escolha == "6":
-            print("\n🔍 VERIFICAÇÃO ESTRUTURA TABELA")
-            try:
-                if firebird_manager.conectar():
-                    if firebird_manager.verificar_estrutura_tabela():
-                        print("✅ Estrutura da tabela TB_LOJA está correta")
-                    else:
-                        print("❌ Problemas na estrutura da tabela TB_LOJA")
-                else:
-                    print("❌ Erro ao conectar no Firebird")
-            except Exception as e:
-                print(f"❌ Erro inesperado: {e}")
-            finally:
-                firebird_manager.desconectar()
-
-        elif escolha == "7":
-            print("\n📈 ESTATÍSTICAS DA TABELA")
-            try:
-                if firebird_manager.conectar():
-                    stats = firebird_manager.obter_estatisticas_tabela()
-                    if stats:
-                        print("✅ Estatísticas da tabela TB_LOJA:")
-                        print(f"   📊 Total de lojas: {stats['total_lojas']}")
-                        print(f"   📅 Timestamp: {stats['timestamp']}")
-                        print(f"   📋 Lojas por status:")
-                        for status, count in stats["lojas_por_status"].items():
-                            print(f"      Status {status}: {count} lojas")
-                    else:
-                        print("❌ Erro ao obter estatísticas")
-                else:
-                    print("❌ Erro ao conectar no Firebird")
-            except Exception as e:
-                print(f"❌ Erro inesperado: {e}")
-            finally:
-                firebird_manager.desconectar()
-
-        elif escolha == "8":
-            print("\n🔌 TESTE DE CONEXÕES")
-
-            # Teste Google Sheets
-            print("📊 Testando Google Sheets...")
-            try:
-                if loja_manager.conectar():
-                    if loja_manager.validar_conexao():
-                        print("   ✅ Google Sheets conectado com sucesso")
-                    else:
-                        print("   ❌ Erro na validação do Google Sheets")
-                else:
-                    print("   ❌ Erro ao conectar no Google Sheets")
-            except Exception as e:
-                print(f"   ❌ Erro inesperado: {e}")
-            finally:
-                loja_manager.desconectar()
-
-            # Teste Firebird
-            print("🔥 Testando Firebird...")
-            try:
-                if firebird_manager.conectar():
-                    if firebird_manager.testar_conexao():
-                        print("   ✅ Firebird conectado com sucesso")
-                    else:
-                        print("   ❌ Erro na validação do Firebird")
-                else:
-                    print("   ❌ Erro ao conectar no Firebird")
-            except Exception as e:
-                print(f"   ❌ Erro inesperado: {e}")
-            finally:
-                firebird_manager.desconectar()
+    # Configurar logging
+    configurar_logging()
 
-        elif escolha == "9":
-            print("\n👋 Saindo do sistema. Até mais!")
-            break
+    # Modo batch não interativo: MenuCMD.py --batch operacoes.csv
+    if len(sys.argv) > 1 and sys.argv[1] == "--batch":
+        if len(sys.argv) < 3:
+            # Sem o arquivo o modo batch não pode rodar: erro de uso em vez
+            # de cair silenciosamente no menu interativo
+            print("❌ Uso: python MenuCMD.py --batch <arquivo_de_operacoes>")
+            sys.exit(2)
+        sucesso = executar_batch(sys.argv[2])
+        sys.exit(0 if sucesso else 1)
 
-        else:
-            print("❌ Opção inválida! Tente novamente.")
+    imprimir_banner()
 
-        # Pausa antes de mostrar menu novamente
-        input("\nPressione Enter para continuar...")
+    # Import e instanciação adiados: abrir o menu e sair (opção 9) não paga
+    # a cadeia de imports do gspread nem do driver fdb
+    loja_manager = None
+    firebird_manager = None
+
+    def _loja_manager():
+        nonlocal loja_manager
+        if loja_manager is None:
+            loja_manager = _criar_loja_manager()
+        return loja_manager
+
+    def _firebird_manager():
+        nonlocal firebird_manager
+        if firebird_manager is None:
+            firebird_manager = _criar_firebird_manager()
+        return firebird_manager
+
+    # Conexões abertas sob demanda e reutilizadas durante toda a sessão
+    try:
+        while True:
+            menu()
+            escolha = _input("Escolha a opção desejada: ").strip()
+
+            if escolha == "9":
+                _print("\n👋 Saindo do sistema. Até mais!")
+                break
+
+            handler = _OPCOES.get(escolha)
+            if handler:
+                handler(_loja_manager, _firebird_manager)
+            else:
+                _print("❌ Opção inválida! Tente novamente.")
+
+            # Pausa antes de mostrar menu novamente
+            _input("\nPressione Enter para continuar...")
+    finally:
+        if loja_manager is not None:
+            loja_manager.desconectar()
+        if firebird_manager is not None:
+            firebird_manager.desconectar()
 
 
 if __name__ == "__main__":
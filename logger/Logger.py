@@ -3,17 +3,36 @@ Módulo de logging para o sistema de fechamento de lojas.
 Configura e disponibiliza funcionalidades de logging padronizadas.
 """
 
+import atexit
 import logging
 import os
+import queue
+from functools import lru_cache, wraps
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
 
+# Níveis aceitos, resolvidos uma vez no import: evita o getattr reflexivo e o
+# try/except de controle de fluxo a cada configuração
+_NIVEIS = {
+    nome: getattr(logging, nome)
+    for nome in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+}
+
+# Configurações já aplicadas, por (nivel, arquivo_log): chamadas repetidas
+# reutilizam os handlers existentes em vez de reabrir arquivo e reanexar tudo
+_configurados: dict = {}
+
+
 def configurar_logging(
     nivel: str = "ERROR", arquivo_log: Optional[str] = None
 ) -> logging.Logger:
     """
     Configura o sistema de logging.
 
+    Chamadas repetidas com os mesmos parâmetros retornam o logger já
+    configurado, sem reconstruir handlers nem reabrir o arquivo de log.
+
     Args:
         nivel (str): Nível de logging (DEBUG, INFO, WARNING, ERROR).
         arquivo_log (Optional[str]): Arquivo para salvar logs. Se None, usa apenas console.
@@ -21,8 +40,19 @@ def configurar_logging(
     Returns:
         logging.Logger: Logger configurado.
     """
+    chave = (nivel.upper(), arquivo_log)
+    logger_memoizado = _configurados.get(chave)
+    if logger_memoizado is not None:
+        return logger_memoizado
+
     logger = logging.getLogger("fechamento_lojas")
 
+    # Para o listener anterior (se houver) antes de reconfigurar
+    listener_anterior = getattr(logger, "_queue_listener", None)
+    if listener_anterior:
+        listener_anterior.stop()
+        logger._queue_listener = None
+
     # Remove handlers existentes para evitar duplicação
     if logger.handlers:
         logger.handlers.clear()
@@ -33,40 +63,80 @@ def configurar_logging(
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
+    # Handlers reais (console e arquivo) ficam atrás de uma fila: o emit no
+    # caminho quente vira apenas um enqueue e a escrita em disco/terminal
+    # acontece em thread de fundo
+    handlers_reais = []
+
     # Handler para console
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers_reais.append(console_handler)
 
     # Handler para arquivo (se especificado)
     if arquivo_log:
         try:
-            # Cria diretório se não existir
+            # Cria diretório se não existir (uma syscall, sem corrida TOCTOU)
             dir_log = os.path.dirname(arquivo_log)
-            if dir_log and not os.path.exists(dir_log):
-                os.makedirs(dir_log)
+            if dir_log:
+                os.makedirs(dir_log, exist_ok=True)
 
             file_handler = logging.FileHandler(arquivo_log, encoding="utf-8")
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            handlers_reais.append(file_handler)
         except Exception as e:
             # Se falhar ao criar arquivo de log, continua apenas com console
             logger.warning(f"Não foi possível criar arquivo de log {arquivo_log}: {e}")
 
+    fila = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(fila))
+
+    listener = QueueListener(fila, *handlers_reais, respect_handler_level=True)
+    listener.start()
+    # Guardado no logger para permitir .stop() no encerramento
+    logger._queue_listener = listener
+    # Garante a drenagem da fila na saída do processo (idempotente)
+    atexit.register(desligar_logging)
+
     # Define o nível
-    try:
-        logger.setLevel(getattr(logging, nivel.upper()))
-    except AttributeError:
-        logger.setLevel(logging.INFO)
+    nivel_resolvido = _NIVEIS.get(nivel.upper())
+    if nivel_resolvido is None:
+        nivel_resolvido = logging.INFO
+        logger.setLevel(nivel_resolvido)
         logger.warning(f"Nível de log inválido '{nivel}', usando INFO")
+    else:
+        logger.setLevel(nivel_resolvido)
+
+    # Uma reconfiguração com parâmetros novos invalida as entradas antigas:
+    # todas apontariam para o mesmo logger com os handlers recém-trocados
+    _configurados.clear()
+    _configurados[chave] = logger
 
     return logger
 
 
+def desligar_logging():
+    """
+    Para o listener de logging em fila, drenando os registros pendentes.
+
+    Seguro para chamar mais de uma vez (as chamadas seguintes são no-op);
+    registrado via atexit por configurar_logging.
+    """
+    logger = logging.getLogger("fechamento_lojas")
+    listener = getattr(logger, "_queue_listener", None)
+    if listener is not None:
+        logger._queue_listener = None
+        listener.stop()
+
+
+@lru_cache(maxsize=256)
 def obter_logger(nome: Optional[str] = None) -> logging.Logger:
     """
     Obtém um logger já configurado.
 
+    Memoizado: chamadas repetidas com o mesmo nome evitam a concatenação
+    da string e o lock interno de ``logging.getLogger``.
+
     Args:
         nome (Optional[str]): Nome do logger. Se None, usa o logger padrão.
 
@@ -81,36 +151,56 @@ def obter_logger(nome: Optional[str] = None) -> logging.Logger:
 class LoggerMixin:
     """Mixin para classes que precisam de logging."""
 
+    # Sem atributos de instância próprios: permite que subclasses adotem
+    # __slots__ sem herdar um __dict__ do mixin
+    __slots__ = ()
+
+    # Loggers por classe concreta: o lower() + getLogger só roda no primeiro
+    # acesso de cada classe; os demais são um fetch de dicionário
+    _loggers_por_classe: dict = {}
+
     @property
     def logger(self) -> logging.Logger:
         """Propriedade para acessar o logger da classe."""
-        nome_classe = self.__class__.__name__
-        return obter_logger(nome_classe.lower())
+        classe = type(self)
+        logger = self._loggers_por_classe.get(classe)
+        if logger is None:
+            logger = obter_logger(classe.__name__.lower())
+            LoggerMixin._loggers_por_classe[classe] = logger
+        return logger
 
 
 def log_operacao(funcao):
     """
     Decorator para logar início e fim de operações.
 
+    O logger e o nome da função são resolvidos uma vez, na decoração; o
+    wrapper não faz lookup por chamada. Com FECHAMENTO_TRACE=0 no ambiente
+    o decorator vira um no-op e devolve a função original.
+
     Args:
         funcao: Função a ser decorada.
 
     Returns:
-        Função decorada com logging.
+        Função decorada com logging (ou a própria função, se desativado).
     """
+    if os.environ.get("FECHAMENTO_TRACE") == "0":
+        return funcao
 
-    def wrapper(*args, **kwargs):
-        logger = obter_logger("operacoes")
-        nome_funcao = funcao.__name__
+    logger = obter_logger("operacoes")
+    nome_funcao = funcao.__name__
 
-        logger.info(f"Iniciando operação: {nome_funcao}")
+    @wraps(funcao)
+    def wrapper(*args, **kwargs):
+        # Formatação %-style adiada: só acontece se o registro passar o nível
+        logger.info("Iniciando operação: %s", nome_funcao)
 
         try:
             resultado = funcao(*args, **kwargs)
-            logger.info(f"Operação concluída com sucesso: {nome_funcao}")
+            logger.info("Operação concluída com sucesso: %s", nome_funcao)
             return resultado
         except Exception as e:
-            logger.error(f"Erro na operação {nome_funcao}: {e}")
+            logger.error("Erro na operação %s: %s", nome_funcao, e)
             raise
 
     return wrapper
@@ -118,6 +208,7 @@ def log_operacao(funcao):
 
 def log_erro(
     mensagem: str,
+    *args,
     exception: Optional[Exception] = None,
     logger: Optional[logging.Logger] = None,
 ):
@@ -125,7 +216,9 @@ def log_erro(
     Função auxiliar para logar erros de forma padronizada.
 
     Args:
-        mensagem (str): Mensagem de erro.
+        mensagem (str): Mensagem de erro (formato %-style).
+        *args: Argumentos do formato, interpolados apenas se o registro
+            passar o filtro de nível.
         exception (Optional[Exception]): Exceção associada ao erro.
         logger (Optional[logging.Logger]): Logger específico a usar.
     """
@@ -133,48 +226,63 @@ def log_erro(
         logger = obter_logger()
 
     if exception:
-        logger.error(f"{mensagem}: {exception}", exc_info=True)
+        if args:
+            logger.error(mensagem, *args, exc_info=True)
+        else:
+            logger.error("%s: %s", mensagem, exception, exc_info=True)
     else:
-        logger.error(mensagem)
+        logger.error(mensagem, *args)
 
 
-def log_info(mensagem: str, logger: Optional[logging.Logger] = None):
+def log_info(mensagem: str, *args, logger: Optional[logging.Logger] = None):
     """
     Função auxiliar para logar informações de forma padronizada.
 
     Args:
-        mensagem (str): Mensagem informativa.
+        mensagem (str): Mensagem informativa (formato %-style).
+        *args: Argumentos do formato, interpolados apenas se o registro
+            passar o filtro de nível.
         logger (Optional[logging.Logger]): Logger específico a usar.
     """
     if logger is None:
         logger = obter_logger()
 
-    logger.info(mensagem)
+    # Sai cedo no nível padrão (ERROR) antes de qualquer trabalho de emissão
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(mensagem, *args)
 
 
-def log_debug(mensagem: str, logger: Optional[logging.Logger] = None):
+def log_debug(mensagem: str, *args, logger: Optional[logging.Logger] = None):
     """
     Função auxiliar para logar debug de forma padronizada.
 
     Args:
-        mensagem (str): Mensagem de debug.
+        mensagem (str): Mensagem de debug (formato %-style).
+        *args: Argumentos do formato, interpolados apenas se o registro
+            passar o filtro de nível.
         logger (Optional[logging.Logger]): Logger específico a usar.
     """
     if logger is None:
         logger = obter_logger()
 
-    logger.debug(mensagem)
+    # Sai cedo no nível padrão (ERROR) antes de qualquer trabalho de emissão
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(mensagem, *args)
 
 
-def log_warning(mensagem: str, logger: Optional[logging.Logger] = None):
+def log_warning(mensagem: str, *args, logger: Optional[logging.Logger] = None):
     """
     Função auxiliar para logar avisos de forma padronizada.
 
     Args:
-        mensagem (str): Mensagem de aviso.
+        mensagem (str): Mensagem de aviso (formato %-style).
+        *args: Argumentos do formato, interpolados apenas se o registro
+            passar o filtro de nível.
         logger (Optional[logging.Logger]): Logger específico a usar.
     """
     if logger is None:
         logger = obter_logger()
 
-    logger.warning(mensagem)
+    # Sai cedo no nível padrão (ERROR) antes de qualquer trabalho de emissão
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(mensagem, *args)
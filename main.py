@@ -13,35 +13,53 @@ from typing import Optional
 from manager.ConfigManager import ConfigManager
 from manager.LojaManager import LojaManager
 from logger.Logger import configurar_logging
-from utils.Utils import listar_formatos_suportados
+from utils.Utils import listar_formatos_suportados, validar_numero_loja
+
+
+# Templates invariantes do loop de resultados, montados uma vez no import
+_OK_FMT = "✅ Loja %s: %s"
+_ERR_FMT = "❌ Loja %s: %s"
+
+# Banner pré-montado: uma única escrita em vez de vários print()
+_BANNER = (
+    "=" * 60
+    + "\n"
+    + "🏪 SISTEMA DE FECHAMENTO DE LOJAS\n"
+    + "   Integração com Google Sheets\n"
+    + "   ✨ Suporte para códigos alfanuméricos (I05, T09, I01, etc.)\n"
+    + "=" * 60
+    + "\n\n"
+)
 
 
 def imprimir_banner():
     """Imprime o banner do sistema."""
-    print("=" * 60)
-    print("🏪 SISTEMA DE FECHAMENTO DE LOJAS")
-    print("   Integração com Google Sheets")
-    print("   ✨ Suporte para códigos alfanuméricos (I05, T09, I01, etc.)")
-    print("=" * 60)
-    print()
+    sys.stdout.write(_BANNER)
 
 
 def imprimir_formatos_suportados():
     """Imprime informações sobre formatos de código suportados."""
     formatos = listar_formatos_suportados()
 
-    print("📋 FORMATOS DE CÓDIGO SUPORTADOS:")
-    print()
-    print("🔢 Numéricos:")
-    print(f"   {', '.join(formatos['numericos'])}")
-    print()
-    print("🔤 Alfanuméricos padrão:")
-    print(f"   {', '.join(formatos['alfanumericos_padrao'])}")
-    print()
-    print("🔀 Variações aceitas (normalizadas automaticamente):")
-    for original, normalizado in formatos["variacao_aceita"].items():
-        print(f"   {original} → {normalizado}")
-    print()
+    linhas = [
+        "📋 FORMATOS DE CÓDIGO SUPORTADOS:",
+        "",
+        "🔢 Numéricos:",
+        f"   {', '.join(formatos['numericos'])}",
+        "",
+        "🔤 Alfanuméricos padrão:",
+        f"   {', '.join(formatos['alfanumericos_padrao'])}",
+        "",
+        "🔀 Variações aceitas (normalizadas automaticamente):",
+    ]
+    linhas.extend(
+        f"   {original} → {normalizado}"
+        for original, normalizado in formatos["variacao_aceita"].items()
+    )
+    linhas.append("")
+
+    # Uma única escrita bufferizada em vez de um print por linha
+    sys.stdout.write("\n".join(linhas) + "\n")
 
 
 def validar_configuracao() -> bool:
@@ -51,8 +69,6 @@ def validar_configuracao() -> bool:
     Returns:
         bool: True se configuração válida, False caso contrário.
     """
-    logger = configurar_logging()
-
     print("📋 Validando configuração...")
 
     try:
@@ -100,8 +116,8 @@ def fechar_loja_unica(numero_loja: str, observacao: Optional[str] = None) -> boo
         if resultado.sucesso:
             print(f"✅ {resultado.mensagem}")
             if resultado.detalhes:
-                print(f"   📅 Data: {resultado.detalhes['data_fechamento']}")
-                print(f"   📝 Observação: {resultado.detalhes['observacao']}")
+                print(f"   📅 Data: {resultado.detalhes.data_fechamento}")
+                print(f"   📝 Observação: {resultado.detalhes.observacao}")
             return True
         else:
             print(f"❌ {resultado.mensagem}")
@@ -175,11 +191,18 @@ def fechar_multiplas_lojas(
     Returns:
         bool: True se pelo menos uma loja foi fechada, False caso contrário.
     """
-    # Parse dos números das lojas
+    # Parse dos números das lojas, validando antes de qualquer chamada de rede
     try:
-        numeros_lojas = [
-            loja.strip() for loja in numeros_lojas_str.split(",") if loja.strip()
-        ]
+        numeros_lojas = []
+        for loja in numeros_lojas_str.split(","):
+            numero = loja.strip()
+            if not numero:
+                continue
+            if not validar_numero_loja(numero):
+                print(f"❌ Código de loja inválido ignorado: {numero}")
+                continue
+            numeros_lojas.append(numero)
+
         if not numeros_lojas:
             print("❌ Nenhum número de loja válido fornecido")
             return False
@@ -201,16 +224,16 @@ def fechar_multiplas_lojas(
         print(f"📋 Processando {len(numeros_lojas)} lojas...")
         print()
 
-        resultados = gerenciador.fechar_multiplas_lojas(numeros_lojas, observacao)
+        resultados = gerenciador.fechar_multiplas_lojas_batch(numeros_lojas, observacao)
 
         # Exibe resultados
         sucessos = 0
         for numero_loja, resultado in resultados.items():
             if resultado.sucesso:
-                print(f"✅ Loja {numero_loja}: {resultado.mensagem}")
+                print(_OK_FMT % (numero_loja, resultado.mensagem))
                 sucessos += 1
             else:
-                print(f"❌ Loja {numero_loja}: {resultado.mensagem}")
+                print(_ERR_FMT % (numero_loja, resultado.mensagem))
 
         print()
         print(f"📊 Resumo: {sucessos}/{len(resultados)} lojas fechadas com sucesso")
@@ -227,17 +250,8 @@ def fechar_multiplas_lojas(
         gerenciador.desconectar()
 
 
-def criar_parser() -> argparse.ArgumentParser:
-    """
-    Cria o parser de argumentos da linha de comando.
-
-    Returns:
-        argparse.ArgumentParser: Parser configurado.
-    """
-    parser = argparse.ArgumentParser(
-        description="Sistema de Fechamento de Lojas - Google Sheets (com informações completas)",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# Epílogo do --help pré-montado como constante de módulo
+_EPILOG = """
 Exemplos de uso:
 
 Códigos numéricos:
@@ -264,7 +278,20 @@ Formatos:
 Configuração:
     Configure Config.json com suas preferências
     Configure Credentials.json com suas credenciais Google Sheets
-        """,
+        """
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    """
+    Cria o parser de argumentos da linha de comando.
+
+    Returns:
+        argparse.ArgumentParser: Parser configurado.
+    """
+    parser = argparse.ArgumentParser(
+        description="Sistema de Fechamento de Lojas - Google Sheets (com informações completas)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
 
     # Grupo mutuamente exclusivo para operações principais
@@ -306,8 +333,9 @@ Configuração:
 def main():
     """Função principal do sistema."""
     try:
-        # Banner
-        imprimir_banner()
+        # Banner apenas em terminal interativo; saída canalizada não o recebe
+        if sys.stdout.isatty():
+            imprimir_banner()
 
         # Parse dos argumentos
         parser = criar_parser()
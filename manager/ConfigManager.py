@@ -5,13 +5,73 @@ ATUALIZADO: Inclui configurações do Firebird.
 
 import json
 import os
+from functools import cached_property, lru_cache
 from typing import Dict, Any
-from logger.Logger import configurar_logging
+from logger.Logger import obter_logger
+from utils.Utils import converter_letra_coluna_para_numero
+
+# Parser SIMD opcional (pysimdjson) para acelerar a leitura do Config.json.
+# O parser é reutilizado entre recargas para aproveitar o buffer interno.
+try:
+    import simdjson
+
+    _PARSER = simdjson.Parser()
+except ImportError:
+    simdjson = None
+    _PARSER = None
+
+# Serializador opcional (orjson) para gravar o Config.json; emite UTF-8
+# direto em bytes, mantendo a semântica de ensure_ascii=False
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Campos que precisam estar preenchidos para a configuração ser válida
+_CAMPOS_OBRIGATORIOS = (
+    "planilha_id",
+    "arquivo_credenciais",
+    "aba_gerenciador",
+    "aba_lojas_fechadas",
+)
+
+
+@lru_cache(maxsize=8)
+def _arquivo_credenciais_existe(caminho: str) -> bool:
+    """Verifica (e memoiza) a existência do arquivo de credenciais."""
+    return os.path.exists(caminho)
 
 
 class ConfigManager:
     """Classe para gerenciar configurações do sistema."""
 
+    # Instâncias compartilhadas por processo, chaveadas por caminho + mtime,
+    # para não re-parsear o Config.json a cada construção
+    _INSTANCES: Dict[tuple, "ConfigManager"] = {}
+
+    def __new__(cls, arquivo_config: str = "config\Config.json"):
+        chave = cls._chave_cache(arquivo_config)
+        if chave is not None:
+            instancia = cls._INSTANCES.get(chave)
+            if instancia is not None:
+                return instancia
+
+        instancia = super().__new__(cls)
+        if chave is not None:
+            cls._INSTANCES[chave] = instancia
+        return instancia
+
+    @classmethod
+    def _chave_cache(cls, arquivo_config: str):
+        """Chave do cache de instâncias: caminho absoluto + mtime do arquivo."""
+        try:
+            return (
+                os.path.abspath(arquivo_config),
+                os.stat(arquivo_config).st_mtime_ns,
+            )
+        except OSError:
+            return None
+
     def __init__(self, arquivo_config: str = "config\Config.json"):
         """
         Inicializa o gerenciador de configurações.
@@ -19,35 +79,74 @@ class ConfigManager:
         Args:
             arquivo_config (str): Caminho para o arquivo de configuração.
         """
-        self.logger = configurar_logging()
+        # Instância reaproveitada do cache já está carregada
+        if getattr(self, "_inicializado", False):
+            return
+
+        # Logger já configurado pelo ponto de entrada; lookup O(1) por nome
+        self.logger = obter_logger("configmanager")
         self.arquivo_config = arquivo_config
         self.config = {}
         self._carregar_configuracao()
+        self._inicializado = True
 
     def _carregar_configuracao(self):
         """Carrega as configurações do arquivo JSON."""
         try:
-            if not os.path.exists(self.arquivo_config):
-                raise FileNotFoundError(
-                    f"Arquivo de configuração não encontrado: {self.arquivo_config}"
-                )
+            # Lê o arquivo inteiro como bytes (sem TextIOWrapper); tanto o
+            # simdjson quanto o json.loads aceitam bytes diretamente. O open
+            # já levanta FileNotFoundError, dispensando o stat prévio.
+            with open(self.arquivo_config, "rb") as f:
+                dados = f.read()
+
+            if _PARSER is not None:
+                self.config = _PARSER.parse(dados).as_dict()
+            else:
+                self.config = json.loads(dados)
 
-            with open(self.arquivo_config, "r", encoding="utf-8") as f:
-                self.config = json.load(f)
+            self._extrair_secoes()
+            self._precalcular_propriedades()
 
             self.logger.info("Configurações carregadas com sucesso")
 
-        except FileNotFoundError as e:
+        except OSError as e:
             self.logger.error(f"Arquivo de configuração não encontrado: {e}")
             raise
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # json.JSONDecodeError e os erros do simdjson derivam de ValueError
             self.logger.error(
                 f"Erro ao decodificar JSON do arquivo de configuração: {e}"
             )
             raise
-        except Exception as e:
-            self.logger.error(f"Erro inesperado ao carregar configuração: {e}")
-            raise
+
+    def _extrair_secoes(self):
+        """
+        Extrai os blocos aninhados da configuração uma única vez.
+
+        Cada propriedade passa a fazer um único dict.get, sem alocar o dict
+        vazio de fallback a cada acesso.
+        """
+        self._gerenciador = self.config.get("configuracoes_gerenciador", {})
+        self._lojas_fechadas = self.config.get("configuracoes_lojas_fechadas", {})
+        self._valores_padrao = self.config.get("valores_padrao", {})
+        self._firebird = self.config.get("configuracoes_firebird", {})
+
+    def _precalcular_propriedades(self):
+        """
+        Resolve todas as propriedades de configuração de uma vez só.
+
+        Os valores ficam em self.__dict__, sombreando o descritor da classe:
+        os acessos seguintes viram um LOAD_ATTR simples, sem dict.get aninhado.
+        """
+        for nome, atributo in type(self).__dict__.items():
+            if isinstance(atributo, cached_property):
+                getattr(self, nome)
+
+    def _invalidar_cache_propriedades(self):
+        """Descarta os valores memoizados pelas cached_property após recarga."""
+        for nome, atributo in type(self).__dict__.items():
+            if isinstance(atributo, cached_property):
+                self.__dict__.pop(nome, None)
 
     def validar_configuracao(self) -> bool:
         """
@@ -57,24 +156,20 @@ class ConfigManager:
             bool: True se a configuração está válida, False caso contrário.
         """
         try:
-            # Verifica campos obrigatórios
-            campos_obrigatorios = [
-                "planilha_id",
-                "arquivo_credenciais",
-                "aba_gerenciador",
-                "aba_lojas_fechadas",
+            # Verifica campos obrigatórios em uma única passada
+            campos_faltantes = [
+                campo for campo in _CAMPOS_OBRIGATORIOS if not self.config.get(campo)
             ]
-
-            for campo in campos_obrigatorios:
-                if campo not in self.config or not self.config[campo]:
+            if campos_faltantes:
+                for campo in campos_faltantes:
                     self.logger.error(
                         f"Campo obrigatório não encontrado ou vazio: {campo}"
                     )
-                    return False
+                return False
 
-            # Verifica se arquivo de credenciais existe
+            # Verifica se arquivo de credenciais existe (stat memoizado)
             arquivo_credenciais = self.config["arquivo_credenciais"]
-            if not os.path.exists(arquivo_credenciais):
+            if not _arquivo_credenciais_existe(arquivo_credenciais):
                 self.logger.error(
                     f"Arquivo de credenciais não encontrado: {arquivo_credenciais}"
                 )
@@ -99,51 +194,61 @@ class ConfigManager:
             return False
 
     # Propriedades Google Sheets (existentes)
-    @property
+    @cached_property
     def planilha_id(self) -> str:
         """ID da planilha Google Sheets."""
         return self.config.get("planilha_id", "")
 
-    @property
+    @cached_property
     def arquivo_credenciais(self) -> str:
         """Caminho para o arquivo de credenciais."""
         return self.config.get("arquivo_credenciais", "Credentials.json")
 
-    @property
+    @cached_property
     def aba_gerenciador(self) -> str:
         """Nome da aba Gerenciador."""
         return self.config.get("aba_gerenciador", "Gerenciador")
 
-    @property
+    @cached_property
     def aba_lojas_fechadas(self) -> str:
         """Nome da aba Lojas Fechadas."""
         return self.config.get("aba_lojas_fechadas", "Lojas Fechadas")
 
-    @property
+    @cached_property
     def coluna_numero_loja_gerenciador(self) -> str:
         """Coluna do número da loja na aba Gerenciador."""
-        return self.config.get("configuracoes_gerenciador", {}).get(
+        return self._gerenciador.get(
             "coluna_numero_loja", "C"
         )
 
-    @property
+    @cached_property
+    def coluna_numero_loja_gerenciador_num(self) -> int:
+        """Número (base 1) da coluna do número da loja, convertido uma vez."""
+        return converter_letra_coluna_para_numero(self.coluna_numero_loja_gerenciador)
+
+    @cached_property
     def coluna_status_gerenciador(self) -> str:
         """Coluna do status na aba Gerenciador."""
-        return self.config.get("configuracoes_gerenciador", {}).get(
+        return self._gerenciador.get(
             "coluna_status", "D"
         )
 
-    @property
+    @cached_property
+    def coluna_status_gerenciador_num(self) -> int:
+        """Número (base 1) da coluna do status, convertido uma vez."""
+        return converter_letra_coluna_para_numero(self.coluna_status_gerenciador)
+
+    @cached_property
     def colunas_limpar_gerenciador(self) -> list:
         """Colunas a limpar na aba Gerenciador."""
-        return self.config.get("configuracoes_gerenciador", {}).get(
+        return self._gerenciador.get(
             "colunas_limpar", ["K"]
         )
 
-    @property
+    @cached_property
     def linha_inicio_gerenciador(self) -> int:
         """Linha de início dos dados na aba Gerenciador."""
-        valor = self.config.get("configuracoes_gerenciador", {}).get("linha_inicio", 6)
+        valor = self._gerenciador.get("linha_inicio", 6)
         # Garantir que seja sempre um inteiro para evitar erro de comparação
         if isinstance(valor, str):
             try:
@@ -155,111 +260,116 @@ class ConfigManager:
                 return 6
         return int(valor) if valor is not None else 6
 
-    @property
+    @cached_property
     def coluna_nome_loja_fechadas(self) -> str:
         """Coluna do nome da loja na aba Lojas Fechadas."""
-        return self.config.get("configuracoes_lojas_fechadas", {}).get(
+        return self._lojas_fechadas.get(
             "coluna_nome_loja", "B"
         )
 
-    @property
+    @cached_property
+    def coluna_nome_loja_fechadas_num(self) -> int:
+        """Número (base 1) da coluna do nome da loja, convertido uma vez."""
+        return converter_letra_coluna_para_numero(self.coluna_nome_loja_fechadas)
+
+    @cached_property
     def coluna_numero_loja_fechadas(self) -> str:
         """Coluna do número da loja na aba Lojas Fechadas."""
-        return self.config.get("configuracoes_lojas_fechadas", {}).get(
+        return self._lojas_fechadas.get(
             "coluna_numero_loja", "C"
         )
 
-    @property
+    @cached_property
     def coluna_status_fechadas(self) -> str:
         """Coluna do status na aba Lojas Fechadas."""
-        return self.config.get("configuracoes_lojas_fechadas", {}).get(
+        return self._lojas_fechadas.get(
             "coluna_status", "D"
         )
 
-    @property
+    @cached_property
     def coluna_data_fechamento(self) -> str:
         """Coluna da data de fechamento na aba Lojas Fechadas."""
-        return self.config.get("configuracoes_lojas_fechadas", {}).get(
+        return self._lojas_fechadas.get(
             "coluna_data_fechamento", "E"
         )
 
-    @property
+    @cached_property
     def coluna_observacao(self) -> str:
         """Coluna da observação na aba Lojas Fechadas."""
-        return self.config.get("configuracoes_lojas_fechadas", {}).get(
+        return self._lojas_fechadas.get(
             "coluna_observacao", "F"
         )
 
-    @property
+    @cached_property
     def status_fechada(self) -> str:
         """Valor do status para loja fechada."""
-        return self.config.get("valores_padrao", {}).get("status_fechada", "Fechada")
+        return self._valores_padrao.get("status_fechada", "Fechada")
 
-    @property
+    @cached_property
     def valor_padrao_status_fechadas(self) -> str:
         """Valor padrão do status na aba Lojas Fechadas."""
-        return self.config.get("valores_padrao", {}).get(
+        return self._valores_padrao.get(
             "status_padrao_lojas_fechadas", "NÃO"
         )
 
     # NOVAS: Propriedades Firebird
-    @property
+    @cached_property
     def firebird_host(self) -> str:
         """Host do banco Firebird."""
-        return self.config.get("configuracoes_firebird", {}).get("host", "localhost")
+        return self._firebird.get("host", "localhost")
 
-    @property
+    @cached_property
     def firebird_database(self) -> str:
         """Nome do banco Firebird."""
-        return self.config.get("configuracoes_firebird", {}).get("database", "CCL_786")
+        return self._firebird.get("database", "CCL_786")
 
-    @property
+    @cached_property
     def firebird_port(self) -> int:
         """Porta do banco Firebird."""
-        return self.config.get("configuracoes_firebird", {}).get("port", 3050)
+        return self._firebird.get("port", 3050)
 
-    @property
+    @cached_property
     def firebird_user(self) -> str:
         """Usuário do banco Firebird."""
-        return self.config.get("configuracoes_firebird", {}).get("user", "SYSDBA")
+        return self._firebird.get("user", "SYSDBA")
 
-    @property
+    @cached_property
     def firebird_password(self) -> str:
         """Senha do banco Firebird."""
-        return self.config.get("configuracoes_firebird", {}).get(
+        return self._firebird.get(
             "password", "masterkey"
         )
 
-    @property
+    @cached_property
     def firebird_charset(self) -> str:
         """Charset do banco Firebird."""
-        return self.config.get("configuracoes_firebird", {}).get("charset", "UTF8")
+        return self._firebird.get("charset", "UTF8")
 
-    @property
+    @cached_property
     def firebird_tabela_loja(self) -> str:
         """Nome da tabela de lojas no Firebird."""
-        return self.config.get("configuracoes_firebird", {}).get(
+        return self._firebird.get(
             "tabela_loja", "TB_LOJA"
         )
 
-    @property
+    @cached_property
     def firebird_coluna_codigo(self) -> str:
         """Nome da coluna de código da loja no Firebird."""
-        return self.config.get("configuracoes_firebird", {}).get(
+        return self._firebird.get(
             "coluna_codigo", "CODLOJA"
         )
 
-    @property
+    @cached_property
     def firebird_coluna_status(self) -> str:
         """Nome da coluna de status no Firebird."""
-        return self.config.get("configuracoes_firebird", {}).get(
+        return self._firebird.get(
             "coluna_status", "ID_STATUS"
         )
 
-    @property
+    @cached_property
     def firebird_status_fechada(self) -> int:
         """Valor do status para loja fechada no Firebird."""
-        return self.config.get("configuracoes_firebird", {}).get("status_fechada", 3)
+        return self._firebird.get("status_fechada", 3)
 
     def obter_configuracao_completa(self) -> Dict[str, Any]:
         """
@@ -283,10 +393,32 @@ class ConfigManager:
         try:
             # Atualiza configurações em memória
             self.config.update(novas_configs)
+            self._extrair_secoes()
+            self._invalidar_cache_propriedades()
+            self._precalcular_propriedades()
 
             # Salva no arquivo
-            with open(self.arquivo_config, "w", encoding="utf-8") as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                payload = orjson.dumps(
+                    self.config,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                )
+                with open(self.arquivo_config, "wb") as f:
+                    f.write(payload)
+            else:
+                with open(self.arquivo_config, "w", encoding="utf-8") as f:
+                    json.dump(self.config, f, indent=2, ensure_ascii=False)
+
+            # O arquivo mudou: remove entradas antigas e registra sob o novo mtime
+            caminho = os.path.abspath(self.arquivo_config)
+            type(self)._INSTANCES = {
+                chave: instancia
+                for chave, instancia in type(self)._INSTANCES.items()
+                if chave[0] != caminho
+            }
+            chave = self._chave_cache(self.arquivo_config)
+            if chave is not None:
+                type(self)._INSTANCES[chave] = self
 
             self.logger.info("Configurações atualizadas com sucesso")
             return True
@@ -4,9 +4,14 @@ CORRIGIDO: Problema com cursor.rowcount no Firebird
 """
 
 import fdb
+import re
 from typing import Optional, List, Any, Dict
+import threading
 import time
+from collections import OrderedDict
+import weakref
 from contextlib import contextmanager
+from datetime import datetime
 
 from manager.ConfigManager import ConfigManager
 from logger.Logger import LoggerMixin, log_operacao
@@ -18,15 +23,146 @@ from utils.Utils import (
 )
 
 
+# Padrão de código alfanumérico (letras + números), compilado uma vez no import
+_RE_ALFANUM = re.compile(r"^([A-Z]+)([0-9]+)$")
+
+
+# SQLs do esquema fixo, montados uma vez no import: além de evitar qualquer
+# trabalho por chamada, o mesmo objeto de string serve de chave estável para o
+# cache de prepared statements
+_SQL_UPDATE_STATUS = """
+    UPDATE TB_LOJA
+    SET ID_STATUS = ?
+    WHERE CODLOJA = ?
+    RETURNING ID_STATUS
+"""
+
+_SQL_BUSCA_FLEXIVEL = """
+    SELECT CODLOJA, ID_STATUS
+    FROM TB_LOJA
+    WHERE UPPER(CODLOJA) IN (?, ?, ?, ?)
+"""
+
+_SQL_LISTAR_POR_STATUS = """
+    SELECT CODLOJA, ID_STATUS
+    FROM TB_LOJA
+    WHERE ID_STATUS = ?
+    ORDER BY CODLOJA
+"""
+
+_SQL_ESTATISTICAS = """
+    SELECT ID_STATUS, COUNT(*)
+    FROM TB_LOJA
+    GROUP BY ID_STATUS
+    ORDER BY ID_STATUS
+"""
+
+
+def _fechar_conexao(conexao):
+    """
+    Fecha uma conexão Firebird a partir do finalizer.
+
+    Função de módulo sem referência à instância: roda com segurança mesmo
+    durante o encerramento do interpretador, quando atributos como o logger
+    podem já ter sido descartados.
+    """
+    try:
+        if conexao is not None:
+            conexao.close()
+    except Exception:
+        pass
+
+
+class LojaInfo:
+    """
+    DTO leve para uma loja do Firebird.
+
+    Com __slots__, cada linha custa uma fração de um dict (sem hashing de
+    chaves), o que pesa nas listagens com milhares de lojas.
+    """
+
+    __slots__ = ("codigo_loja", "id_status", "nome")
+
+    def __init__(
+        self, codigo_loja: str, id_status: int, nome: str = "Nome não disponível"
+    ):
+        self.codigo_loja = codigo_loja
+        self.id_status = id_status
+        self.nome = nome
+
+    def __repr__(self):
+        return (
+            f"LojaInfo(codigo_loja={self.codigo_loja!r}, "
+            f"id_status={self.id_status!r}, nome={self.nome!r})"
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Converte para dict, para chamadores que precisam desse formato."""
+        return {
+            "codigo_loja": self.codigo_loja,
+            "id_status": self.id_status,
+            "nome": self.nome,
+        }
+
+
 class FirebirdManager(LoggerMixin):
     """Classe para gerenciar operações com banco Firebird."""
 
+    # Limite do cache de prepared statements (LRU)
+    _MAX_PS_CACHE = 64
+
+    # Validade, em segundos, do cache de status por loja
+    _TTL_STATUS_CACHE = 5.0
+
+    # Validade, em segundos, do cache de lojas resolvidas
+    _TTL_LOJA_CACHE = 60.0
+
     def __init__(self):
         """Inicializa o gerenciador do Firebird."""
         self.config = ConfigManager()
         self.conexao = None
         self.conectado = False
 
+        # Cache de esquema: colunas de TB_LOJA, SQL de busca pré-montado e
+        # resultado da verificação de estrutura, preenchidos na primeira
+        # consulta (uma query de metadados por instância)
+        self._tb_loja_colunas = None
+        self._sql_buscar_loja = None
+        self._estrutura_ok: Optional[bool] = None
+
+        # Cursor persistente e cache LRU de prepared statements: consultas
+        # repetidas reutilizam o plano em vez de pagar parse+prepare a cada vez
+        self._cursor = None
+        self._ps_cache: "OrderedDict[str, Any]" = OrderedDict()
+
+        # O fdb é threadsafety nível 1: conexão e cursor não podem ser usados
+        # por duas threads ao mesmo tempo. Esta trava reentrante serializa
+        # cada operação completa (execute -> fetch -> commit) dentro do
+        # próprio gerenciador, sem depender de disciplina dos chamadores
+        self._trava = threading.RLock()
+
+        # Leituras desde o último commit: a transação longa é liberada
+        # periodicamente (commit retaining) para não segurar o garbage
+        # collection do servidor
+        self._leituras_desde_commit = 0
+
+        # Transação de lote aberta (vários statements antes de um único
+        # commit): enquanto ativa, o _exec não tenta reconectar — perder a
+        # conexão descartaria os statements anteriores do lote
+        self._transacao_em_lote = False
+
+        # Cache curto de status por loja (valor, timestamp): consultas
+        # repetidas dentro do TTL não voltam ao banco
+        self._status_cache: Dict[str, tuple] = {}
+
+        # Cache com TTL de lojas já resolvidas (LojaInfo, timestamp): fluxos
+        # de verificação seguida de atualização não repetem o SELECT
+        self._loja_cache: Dict[str, tuple] = {}
+
+        # Finalizer da conexão ativa (substitui __del__, que é inseguro no
+        # encerramento do interpretador)
+        self._finalizer = None
+
         # Configurações do banco usando ConfigManager
         self.host = self.config.firebird_host
         self.database = self.config.firebird_database
@@ -44,32 +180,8 @@ class FirebirdManager(LoggerMixin):
             bool: True se conectado com sucesso, False caso contrário.
         """
         try:
-            self.logger.info("Iniciando conexão com Firebird...")
-
-            # String de conexão para Firebird
-            dsn = f"{self.host}/{self.port}:{self.database}"
-
-            self.logger.debug(f"Conectando ao DSN: {dsn}")
-
-            # Estabelece conexão
-            self.conexao = fdb.connect(
-                dsn=dsn, user=self.user, password=self.password, charset=self.charset
-            )
-
-            # Testa a conexão
-            if self.conexao:
-                cursor = self.conexao.cursor()
-                cursor.execute("SELECT 1 FROM RDB$DATABASE")
-                cursor.fetchone()
-                cursor.close()
-
-                self.conectado = True
-                self.logger.info("Conexão com Firebird estabelecida com sucesso!")
-                return True
-            else:
-                self.logger.error("Falha ao estabelecer conexão com Firebird")
-                return False
-
+            with self._trava:
+                return self._conectar_travado()
         except fdb.DatabaseError as e:
             self.logger.error(f"Erro de banco de dados ao conectar: {e}")
             return False
@@ -77,77 +189,285 @@ class FirebirdManager(LoggerMixin):
             self.logger.error(f"Erro inesperado ao conectar no Firebird: {e}")
             return False
 
+    def _conectar_travado(self) -> bool:
+        """Corpo de conectar, executado sob a trava da instância."""
+        self.logger.info("Iniciando conexão com Firebird...")
+
+        # String de conexão para Firebird
+        dsn = f"{self.host}/{self.port}:{self.database}"
+
+        self.logger.debug(f"Conectando ao DSN: {dsn}")
+
+        # Estabelece conexão com opções explícitas: dialeto 3 e isolamento
+        # read-committed definidos no connect evitam a negociação implícita
+        # de TPB a cada primeira instrução de transação
+        self.conexao = fdb.connect(
+            dsn=dsn,
+            user=self.user,
+            password=self.password,
+            charset=self.charset,
+            sql_dialect=3,
+            isolation_level=fdb.ISOLATION_LEVEL_READ_COMMITED,
+        )
+
+        # Testa a conexão já com o cursor de longa duração da sessão:
+        # nenhum cursor descartável é criado (evita o acúmulo de weakrefs
+        # de cursores mortos na transação do fdb)
+        if self.conexao:
+            self._cursor = self.conexao.cursor()
+            self._cursor.execute("SELECT 1 FROM RDB$DATABASE")
+            self._cursor.fetchone()
+            self._ps_cache.clear()
+
+            # Garante o fechamento da conexão quando a instância morrer,
+            # sem depender de __del__
+            if self._finalizer is not None:
+                self._finalizer.detach()
+            self._finalizer = weakref.finalize(
+                self, _fechar_conexao, self.conexao
+            )
+
+            self.conectado = True
+            self.logger.info("Conexão com Firebird estabelecida com sucesso!")
+            return True
+        else:
+            self.logger.error("Falha ao estabelecer conexão com Firebird")
+            return False
+
+    def assegurar_conexao(self) -> bool:
+        """
+        Garante que há conexão ativa com o Firebird, reconectando apenas se a
+        conexão caiu (reaproveita a sessão entre operações).
+
+        Returns:
+            bool: True se conectado, False caso contrário.
+        """
+        if self.conectado and self.conexao is not None:
+            if self.testar_conexao():
+                return True
+            self.logger.warning("Conexão Firebird inativa, reconectando...")
+            self.desconectar()
+        return self.conectar()
+
     @contextmanager
     def obter_cursor(self):
         """
         Context manager para obter cursor do banco de forma segura.
 
+        Reutiliza o cursor persistente da sessão: criar e fechar um cursor
+        por operação descartaria os prepared statements cacheados. A trava
+        da instância fica retida durante todo o bloco with do chamador,
+        cobrindo execute e fetch de uma vez.
+
         Yields:
             fdb.Cursor: Cursor do banco de dados.
         """
         if not self.conectado or not self.conexao:
             raise Exception("Não conectado ao banco Firebird")
 
-        cursor = None
-        try:
-            cursor = self.conexao.cursor()
-            yield cursor
-        finally:
-            if cursor:
-                cursor.close()
+        with self._trava:
+            if self._cursor is None:
+                self._cursor = self.conexao.cursor()
+
+            yield self._cursor
+
+    def _exec(self, sql: str, params=()):
+        """
+        Executa SQL pelo cache de prepared statements.
+
+        Na primeira execução de cada SQL o statement é preparado e guardado;
+        repetições reutilizam o plano já compilado (evita parse+describe por
+        chamada). Cache LRU limitado a _MAX_PS_CACHE entradas.
+
+        Se a conexão persistente tiver morrido (ex.: reinício do servidor),
+        reconecta uma única vez de forma transparente e repete a execução —
+        validação na borda, como em um pool com checagem no checkout. A
+        exceção é uma transação de lote aberta: fechar a conexão descartaria
+        os statements anteriores ainda não commitados e o retry continuaria o
+        lote como se nada tivesse sido perdido, então nesse caso o erro
+        propaga para o chamador desfazer o lote inteiro.
+
+        A execução acontece sob a trava reentrante da instância. Chamadores
+        que ainda vão consumir o resultado (fetch) devem segurar a mesma
+        trava até o fim da operação — os métodos públicos desta classe já
+        fazem isso.
+
+        Args:
+            sql (str): SQL parametrizado.
+            params: Parâmetros da consulta.
+
+        Returns:
+            fdb.Cursor: Cursor persistente já posicionado no resultado.
+        """
+        if not self.conectado or not self.conexao:
+            raise Exception("Não conectado ao banco Firebird")
+
+        with self._trava:
+            try:
+                return self._executar_preparado(sql, params)
+            except fdb.DatabaseError:
+                if self._transacao_em_lote:
+                    # Reconectar aqui perderia os UPDATEs anteriores do lote
+                    # (fechar a conexão faz rollback implícito) e repetir só o
+                    # statement corrente reportaria sucesso para trabalho
+                    # desfeito: o lote precisa falhar e recomeçar por inteiro
+                    raise
+                # Socket possivelmente morto: uma tentativa de reconexão; se a
+                # falha for da própria consulta, o erro se repete e propaga
+                self.logger.warning(
+                    "Conexão Firebird possivelmente inativa, reconectando..."
+                )
+                self.desconectar()
+                if not self.conectar():
+                    raise
+                return self._executar_preparado(sql, params)
+
+    def _executar_preparado(self, sql: str, params=()):
+        """
+        Executa o SQL no cursor persistente usando o cache de statements.
+
+        Args:
+            sql (str): SQL parametrizado.
+            params: Parâmetros da consulta.
+
+        Returns:
+            fdb.Cursor: Cursor persistente já posicionado no resultado.
+        """
+        if self._cursor is None:
+            self._cursor = self.conexao.cursor()
+
+        # A cada 1000 leituras, commit retaining libera a transação antiga
+        # (contém o crescimento da TIP) sem invalidar cursor nem statements.
+        # Suspenso durante transação de lote: um commit no meio quebraria a
+        # garantia de commit único (o rollback do lote deixaria de desfazer
+        # os UPDATEs já confirmados pelo retaining)
+        if not self._transacao_em_lote:
+            if self._leituras_desde_commit >= 1000:
+                self.conexao.commit(retaining=True)
+                self._leituras_desde_commit = 0
+            self._leituras_desde_commit += 1
+
+        ps = self._ps_cache.get(sql)
+        if ps is None:
+            ps = self._cursor.prep(sql)
+            self._ps_cache[sql] = ps
+            if len(self._ps_cache) > self._MAX_PS_CACHE:
+                self._ps_cache.popitem(last=False)
+        else:
+            self._ps_cache.move_to_end(sql)
+
+        self._cursor.execute(ps, params)
+        return self._cursor
 
     @log_operacao
     def verificar_estrutura_tabela(self) -> bool:
         """
         Verifica se a tabela TB_LOJA existe e tem as colunas necessárias.
 
+        O resultado é memoizado na instância: o esquema não muda durante a
+        sessão, então as consultas às tabelas de sistema RDB$ rodam uma única
+        vez (use invalidar_cache_estrutura após DDL).
+
         Returns:
             bool: True se estrutura está correta, False caso contrário.
         """
-        try:
-            with self.obter_cursor() as cursor:
-                # Verifica se a tabela existe
-                sql_tabela = """
-                    SELECT COUNT(*) 
-                    FROM RDB$RELATIONS 
-                    WHERE RDB$RELATION_NAME = 'TB_LOJA'
-                """
-                cursor.execute(sql_tabela)
-                resultado = cursor.fetchone()
+        if self._estrutura_ok is not None:
+            return self._estrutura_ok
 
-                if not resultado or resultado[0] == 0:
-                    self.logger.error("Tabela TB_LOJA não encontrada")
-                    return False
+        try:
+            # Uma única consulta de metadados (JOIN) em vez de duas
+            sql = """
+                SELECT f.RDB$FIELD_NAME
+                FROM RDB$RELATIONS r
+                LEFT JOIN RDB$RELATION_FIELDS f
+                    ON r.RDB$RELATION_NAME = f.RDB$RELATION_NAME
+                WHERE r.RDB$RELATION_NAME = 'TB_LOJA'
+            """
+            with self._trava:
+                cursor = self._exec(sql)
+                linhas = cursor.fetchall()
+
+            if not linhas:
+                self.logger.error("Tabela TB_LOJA não encontrada")
+                self._estrutura_ok = False
+                return False
 
-                # Verifica se as colunas existem
-                sql_colunas = """
-                    SELECT RDB$FIELD_NAME 
-                    FROM RDB$RELATION_FIELDS 
-                    WHERE RDB$RELATION_NAME = 'TB_LOJA' 
-                    AND RDB$FIELD_NAME IN ('CODLOJA', 'ID_STATUS')
-                """
-                cursor.execute(sql_colunas)
-                colunas = [row[0].strip() for row in cursor.fetchall()]
+            colunas = {row[0].strip() for row in linhas if row[0]}
 
-                if "CODLOJA" not in colunas:
-                    self.logger.error("Coluna CODLOJA não encontrada na tabela TB_LOJA")
-                    return False
+            if "CODLOJA" not in colunas:
+                self.logger.error("Coluna CODLOJA não encontrada na tabela TB_LOJA")
+                self._estrutura_ok = False
+                return False
 
-                if "ID_STATUS" not in colunas:
-                    self.logger.error(
-                        "Coluna ID_STATUS não encontrada na tabela TB_LOJA"
-                    )
-                    return False
+            if "ID_STATUS" not in colunas:
+                self.logger.error(
+                    "Coluna ID_STATUS não encontrada na tabela TB_LOJA"
+                )
+                self._estrutura_ok = False
+                return False
 
-                self.logger.info("Estrutura da tabela TB_LOJA verificada com sucesso")
-                return True
+            self.logger.info("Estrutura da tabela TB_LOJA verificada com sucesso")
+            self._estrutura_ok = True
+            return True
 
         except Exception as e:
             self.logger.error(f"Erro ao verificar estrutura da tabela: {e}")
             return False
 
+    def invalidar_cache_estrutura(self):
+        """Descarta o resultado memoizado da verificação de estrutura."""
+        self._estrutura_ok = None
+        self._tb_loja_colunas = None
+        self._sql_buscar_loja = None
+
+    def _obter_colunas_tb_loja(self) -> set:
+        """
+        Obtém (e cacheia) o conjunto de colunas da tabela TB_LOJA.
+
+        Returns:
+            set: Nomes das colunas da tabela.
+        """
+        if self._tb_loja_colunas is None:
+            with self.obter_cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT RDB$FIELD_NAME
+                    FROM RDB$RELATION_FIELDS
+                    WHERE RDB$RELATION_NAME = 'TB_LOJA'
+                """
+                )
+                self._tb_loja_colunas = {
+                    row[0].strip() for row in cursor.fetchall()
+                }
+        return self._tb_loja_colunas
+
+    def _obter_sql_buscar_loja(self) -> str:
+        """
+        Monta (e cacheia) o SELECT de busca de loja conforme o esquema.
+
+        Inclui APELIDO no mesmo SELECT quando a coluna existe, evitando a
+        segunda ida ao banco por consulta.
+
+        Returns:
+            str: SQL parametrizado de busca por CODLOJA.
+        """
+        if self._sql_buscar_loja is None:
+            if "APELIDO" in self._obter_colunas_tb_loja():
+                self._sql_buscar_loja = """
+                    SELECT CODLOJA, ID_STATUS, APELIDO
+                    FROM TB_LOJA
+                    WHERE CODLOJA = ?
+                """
+            else:
+                self._sql_buscar_loja = """
+                    SELECT CODLOJA, ID_STATUS
+                    FROM TB_LOJA
+                    WHERE CODLOJA = ?
+                """
+        return self._sql_buscar_loja
+
     @log_operacao
-    def buscar_loja_por_codigo(self, codigo_loja: str) -> Optional[Dict[str, Any]]:
+    def buscar_loja_por_codigo(self, codigo_loja: str) -> Optional[LojaInfo]:
         """
         Busca uma loja pelo código na tabela TB_LOJA.
 
@@ -155,7 +475,7 @@ class FirebirdManager(LoggerMixin):
             codigo_loja (str): Código da loja para buscar.
 
         Returns:
-            Optional[Dict]: Informações da loja ou None se não encontrada.
+            Optional[LojaInfo]: Informações da loja ou None se não encontrada.
         """
         try:
             if not validar_numero_loja(codigo_loja):
@@ -165,79 +485,86 @@ class FirebirdManager(LoggerMixin):
             # Normaliza o código da loja
             codigo_normalizado = normalizar_tipo_numero_loja(codigo_loja)
 
+            # Loja já resolvida dentro do TTL: devolve sem ir ao banco
+            entrada = self._loja_cache.get(codigo_normalizado)
+            if entrada is not None:
+                loja_cacheada, momento = entrada
+                if time.monotonic() - momento < self._TTL_LOJA_CACHE:
+                    return loja_cacheada
+                del self._loja_cache[codigo_normalizado]
+
             self.logger.info(f"Buscando loja {codigo_loja} na tabela TB_LOJA...")
 
-            with self.obter_cursor() as cursor:
-                # Query para buscar a loja
-                sql = """
-                    SELECT CODLOJA, ID_STATUS
-                    FROM TB_LOJA 
-                    WHERE CODLOJA = ?
-                """
+            # Um único SELECT com todas as colunas disponíveis: metade das
+            # idas ao banco em relação à versão com consulta extra de APELIDO
+            sql = self._obter_sql_buscar_loja()
 
-                self.logger.debug(
-                    f"Executando SQL: {sql} com parâmetro: {codigo_normalizado}"
-                )
+            self.logger.debug(
+                f"Executando SQL: {sql} com parâmetro: {codigo_normalizado}"
+            )
 
-                cursor.execute(sql, (codigo_normalizado,))
+            with self._trava:
+                cursor = self._exec(sql, (codigo_normalizado,))
                 resultado = cursor.fetchone()
 
-                if resultado and len(resultado) >= 2:
-                    loja_info = {
-                        "codigo_loja": (
-                            str(resultado[0]).strip()
-                            if resultado[0]
-                            else codigo_normalizado
-                        ),
-                        "id_status": (
-                            int(resultado[1]) if resultado[1] is not None else 0
-                        ),
-                    }
-
-                    # Tenta obter nome se existe coluna NOME
-                    try:
-                        sql_nome = """
-                            SELECT APELIDO
-                            FROM TB_LOJA 
-                            WHERE CODLOJA = ?
-                        """
-                        cursor.execute(sql_nome, (codigo_normalizado,))
-                        resultado_nome = cursor.fetchone()
-                        loja_info["nome"] = (
-                            str(resultado_nome[0]).strip()
-                            if resultado_nome and resultado_nome[0]
-                            else "Nome não informado"
-                        )
-                    except:
-                        loja_info["nome"] = "Nome não disponível"
+            # O SELECT lista as colunas explicitamente: basta checar a linha
+            if resultado:
+                loja_info = LojaInfo(
+                    codigo_loja=(
+                        str(resultado[0]).strip()
+                        if resultado[0]
+                        else codigo_normalizado
+                    ),
+                    id_status=(
+                        int(resultado[1]) if resultado[1] is not None else 0
+                    ),
+                    nome=(
+                        str(resultado[2]).strip()
+                        if len(resultado) >= 3 and resultado[2]
+                        else "Nome não disponível"
+                    ),
+                )
 
-                    self.logger.info(f"Loja {codigo_loja} encontrada: {loja_info}")
-                    return loja_info
-                else:
-                    # Tenta busca com comparação flexível para códigos alfanuméricos
-                    if validar_codigo_alfanumerico(codigo_normalizado):
-                        return self._buscar_loja_alfanumerica_flexivel(
-                            codigo_normalizado
+                self.logger.info(f"Loja {codigo_loja} encontrada: {loja_info}")
+                self._loja_cache[codigo_normalizado] = (
+                    loja_info,
+                    time.monotonic(),
+                )
+                return loja_info
+            else:
+                # Código puramente numérico não tem variantes flexíveis:
+                # sai direto sem pagar a validação alfanumérica (regex)
+                if not codigo_normalizado.isdigit() and validar_codigo_alfanumerico(
+                    codigo_normalizado
+                ):
+                    loja_info = self._buscar_loja_alfanumerica_flexivel(
+                        codigo_normalizado
+                    )
+                    if loja_info is not None:
+                        self._loja_cache[codigo_normalizado] = (
+                            loja_info,
+                            time.monotonic(),
                         )
+                    return loja_info
 
-                    self.logger.warning(
-                        f"Loja {codigo_loja} não encontrada na tabela TB_LOJA"
-                    )
-                    return None
+                self.logger.warning(
+                    f"Loja {codigo_loja} não encontrada na tabela TB_LOJA"
+                )
+                return None
 
         except fdb.DatabaseError as e:
             self.logger.error(f"Erro de banco ao buscar loja {codigo_loja}: {e}")
             return None
         except Exception as e:
-            self.logger.error(f"Erro inesperado ao buscar loja {codigo_loja}: {e}")
-            import traceback
-
-            self.logger.debug(f"Traceback: {traceback.format_exc()}")
+            # logger.exception formata o traceback apenas se o handler emitir
+            self.logger.exception(
+                f"Erro inesperado ao buscar loja {codigo_loja}: {e}"
+            )
             return None
 
     def _buscar_loja_alfanumerica_flexivel(
         self, codigo_normalizado: str
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[LojaInfo]:
         """
         Busca flexível para códigos alfanuméricos (I5 = I05, etc.).
 
@@ -245,47 +572,50 @@ class FirebirdManager(LoggerMixin):
             codigo_normalizado (str): Código normalizado para buscar.
 
         Returns:
-            Optional[Dict]: Informações da loja ou None se não encontrada.
+            Optional[LojaInfo]: Informações da loja ou None se não encontrada.
         """
         try:
-            with self.obter_cursor() as cursor:
-                # Busca todos os códigos que começam com as mesmas letras
-                import re
-
-                match = re.match(r"^([A-Z]+)([0-9]+)$", codigo_normalizado.upper())
-
-                if match:
-                    letras, numeros = match.groups()
+            codigo_maiusculo = codigo_normalizado.upper()
+            match = _RE_ALFANUM.match(codigo_maiusculo)
+
+            if match:
+                letras, numeros = match.groups()
+
+                # Gera as variações plausíveis de zeros à esquerda (I5, I05,
+                # I005, I0005) e resolve tudo em um único IN indexado, em vez
+                # de transferir todos os códigos do prefixo e comparar aqui
+                valor_numerico = int(numeros)
+                variacoes = list(
+                    dict.fromkeys(
+                        f"{letras}{valor_numerico:0{largura}d}"
+                        for largura in range(1, 5)
+                    )
+                )
 
-                    # Busca códigos que começam com as mesmas letras
-                    sql = """
-                        SELECT CODLOJA, ID_STATUS
-                        FROM TB_LOJA 
-                        WHERE UPPER(CODLOJA) STARTING WITH ?
-                    """
+                # Completa com a própria variação quando há repetidas (o IN
+                # exige exatamente quatro parâmetros para reusar o statement)
+                parametros = (variacoes + [variacoes[-1]] * 4)[:4]
+
+                with self._trava:
+                    cursor = self._exec(_SQL_BUSCA_FLEXIVEL, tuple(parametros))
+                    resultado = cursor.fetchone()
+
+                if resultado:
+                    codigo_bd = str(resultado[0]).strip()
+                    if comparar_numeros_loja(codigo_bd, codigo_normalizado):
+                        loja_info = LojaInfo(
+                            codigo_loja=codigo_bd,
+                            id_status=(
+                                int(resultado[1])
+                                if resultado[1] is not None
+                                else 0
+                            ),
+                        )
 
-                    cursor.execute(sql, (letras,))
-                    resultados = cursor.fetchall()
-
-                    # Compara cada resultado encontrado
-                    for resultado in resultados:
-                        if len(resultado) >= 2:
-                            codigo_bd = str(resultado[0]).strip()
-                            if comparar_numeros_loja(codigo_bd, codigo_normalizado):
-                                loja_info = {
-                                    "codigo_loja": codigo_bd,
-                                    "id_status": (
-                                        int(resultado[1])
-                                        if resultado[1] is not None
-                                        else 0
-                                    ),
-                                    "nome": "Nome não disponível",
-                                }
-
-                                self.logger.info(
-                                    f"Loja encontrada com busca flexível: {loja_info}"
-                                )
-                                return loja_info
+                        self.logger.info(
+                            f"Loja encontrada com busca flexível: {loja_info}"
+                        )
+                        return loja_info
 
             return None
 
@@ -296,8 +626,11 @@ class FirebirdManager(LoggerMixin):
     @log_operacao
     def atualizar_status_loja(self, codigo_loja: str, novo_status: int = 3) -> bool:
         """
-        CORRIGIDA: Atualiza o ID_STATUS da loja na tabela TB_LOJA.
-        Corrigido problema com cursor.rowcount no Firebird.
+        Atualiza o ID_STATUS da loja na tabela TB_LOJA.
+
+        Usa UPDATE ... RETURNING: a própria escrita confirma se a linha
+        existia e devolve o status gravado, dispensando os SELECTs de
+        pré-verificação e de confirmação (uma ida ao banco em vez de várias).
 
         Args:
             codigo_loja (str): Código da loja para atualizar.
@@ -311,77 +644,72 @@ class FirebirdManager(LoggerMixin):
                 self.logger.error(f"Código de loja inválido: {codigo_loja}")
                 return False
 
-            # Primeiro verifica se a loja existe
-            loja_info = self.buscar_loja_por_codigo(codigo_loja)
-            if not loja_info:
-                self.logger.error(f"Loja {codigo_loja} não encontrada para atualização")
-                return False
-
-            status_anterior = loja_info["id_status"]
+            codigo_normalizado = normalizar_tipo_numero_loja(codigo_loja)
 
             self.logger.info(
-                f"Atualizando status da loja {codigo_loja} de {status_anterior} para {novo_status}..."
+                f"Atualizando status da loja {codigo_loja} para {novo_status}..."
             )
 
-            with self.obter_cursor() as cursor:
-                # SQL para atualizar o status
-                sql = """
-                    UPDATE TB_LOJA 
-                    SET ID_STATUS = ? 
-                    WHERE CODLOJA = ?
-                """
+            # UPDATE com RETURNING: nenhuma linha retornada = loja inexistente
+            self.logger.debug(
+                "Executando UPDATE de status com parâmetros: %s, %s",
+                novo_status,
+                codigo_normalizado,
+            )
 
-                self.logger.debug(
-                    f"Executando SQL: {sql} com parâmetros: {novo_status}, {loja_info['codigo_loja']}"
+            with self._trava:
+                cursor = self._exec(
+                    _SQL_UPDATE_STATUS, (novo_status, codigo_normalizado)
                 )
+                linha = cursor.fetchone()
+
+                # No Firebird 5 um UPDATE sem linhas não retorna nada, mas no
+                # Firebird <= 4 o fdb segue o caminho de exec_procedure e o
+                # fetchone devolve (None,): os dois casos significam loja
+                # inexistente
+                if (linha is None or linha[0] is None) and validar_codigo_alfanumerico(
+                    codigo_normalizado
+                ):
+                    # Código pode estar com zeros a menos (I5 = I05): resolve o
+                    # código exato do banco e tenta o UPDATE uma única vez mais
+                    loja_info = self._buscar_loja_alfanumerica_flexivel(
+                        codigo_normalizado
+                    )
+                    if loja_info:
+                        cursor = self._exec(
+                            _SQL_UPDATE_STATUS, (novo_status, loja_info.codigo_loja)
+                        )
+                        linha = cursor.fetchone()
 
-                # Executa a atualização usando o código exato encontrado no banco
-                cursor.execute(sql, (novo_status, loja_info["codigo_loja"]))
+                if linha is None or linha[0] is None:
+                    self.conexao.rollback()
+                    self.logger.error(
+                        f"Loja {codigo_loja} não encontrada para atualização"
+                    )
+                    return False
 
                 # Commit da transação
                 self.conexao.commit()
 
-                # CORREÇÃO: Verifica se a atualização foi bem-sucedida fazendo uma nova consulta
-                # Em vez de confiar no cursor.rowcount que pode não funcionar corretamente no Firebird
-                loja_info_atualizada = self.buscar_loja_por_codigo(codigo_loja)
+            # O status mudou: descarta as entradas correspondentes dos caches
+            self._status_cache.pop(codigo_loja, None)
+            self._status_cache.pop(codigo_normalizado, None)
+            self._loja_cache.pop(codigo_normalizado, None)
 
-                if (
-                    loja_info_atualizada
-                    and loja_info_atualizada["id_status"] == novo_status
-                ):
-                    self.logger.info(
-                        f"✅ Status da loja {codigo_loja} atualizado com sucesso de {status_anterior} para {novo_status}"
-                    )
-                    return True
-                elif (
-                    loja_info_atualizada
-                    and loja_info_atualizada["id_status"] == status_anterior
-                ):
-                    # Status não mudou - pode ser que já estava no valor desejado
-                    if status_anterior == novo_status:
-                        self.logger.info(
-                            f"ℹ️  Loja {codigo_loja} já estava com status {novo_status}"
-                        )
-                        return True
-                    else:
-                        self.logger.warning(
-                            f"❌ Status da loja {codigo_loja} não foi alterado (permanece {status_anterior})"
-                        )
-                        return False
-                else:
-                    self.logger.warning(
-                        f"❌ Não foi possível confirmar a atualização da loja {codigo_loja}"
-                    )
-                    return False
+            self.logger.info(
+                f"✅ Status da loja {codigo_loja} atualizado com sucesso para {novo_status}"
+            )
+            return True
 
         except fdb.DatabaseError as e:
             self.logger.error(
                 f"Erro de banco ao atualizar status da loja {codigo_loja}: {e}"
             )
             try:
-                if self.conexao:
-                    self.conexao.rollback()
-            except:
+                with self._trava:
+                    if self.conexao:
+                        self.conexao.rollback()
+            except fdb.DatabaseError:
                 pass
             return False
         except Exception as e:
@@ -389,53 +717,175 @@ class FirebirdManager(LoggerMixin):
                 f"Erro inesperado ao atualizar status da loja {codigo_loja}: {e}"
             )
             try:
-                if self.conexao:
-                    self.conexao.rollback()
-            except:
+                with self._trava:
+                    if self.conexao:
+                        self.conexao.rollback()
+            except fdb.DatabaseError:
                 pass
             return False
 
     @log_operacao
-    def listar_lojas_por_status(self, status: int) -> List[Dict[str, Any]]:
+    def atualizar_status_lojas(
+        self, codigos_lojas: List[str], novo_status: int = 3
+    ) -> Dict[str, bool]:
         """
-        Lista todas as lojas com um determinado status.
+        Atualiza o ID_STATUS de várias lojas em uma única transação.
+
+        O UPDATE é preparado uma vez e executado por loja (prepare once,
+        bind many — o executemany do fdb re-prepara a cada item), e os N
+        commits individuais colapsam em um só. Se a conexão cair no meio do
+        lote, a transação inteira é desfeita e todos os códigos voltam como
+        False — o chamador pode então repetir o lote do zero.
 
         Args:
-            status (int): Status para filtrar.
+            codigos_lojas (List[str]): Códigos das lojas para atualizar.
+            novo_status (int): Novo status (padrão: 3).
 
         Returns:
-            List[Dict]: Lista de lojas com o status especificado.
+            Dict[str, bool]: Sucesso por código de loja informado.
         """
+        resultados: Dict[str, bool] = {}
+
         try:
-            self.logger.info(f"Listando lojas com status {status}...")
+            with self._trava:
+                # Enquanto o lote está aberto o _exec não reconecta: uma queda
+                # de conexão no meio derruba a transação inteira (todos os
+                # códigos voltam como False), nunca só o statement corrente
+                self._transacao_em_lote = True
+                try:
+                    for codigo_loja in codigos_lojas:
+                        if not validar_numero_loja(codigo_loja):
+                            self.logger.error(
+                                f"Código de loja inválido: {codigo_loja}"
+                            )
+                            resultados[codigo_loja] = False
+                            continue
+
+                        codigo_normalizado = normalizar_tipo_numero_loja(
+                            codigo_loja
+                        )
 
-            with self.obter_cursor() as cursor:
-                sql = """
-                    SELECT CODLOJA, ID_STATUS
-                    FROM TB_LOJA 
-                    WHERE ID_STATUS = ?
-                    ORDER BY CODLOJA
-                """
+                        cursor = self._exec(
+                            _SQL_UPDATE_STATUS, (novo_status, codigo_normalizado)
+                        )
+                        linha = cursor.fetchone()
+
+                        # No Firebird <= 4 um UPDATE sem linhas devolve (None,)
+                        # em vez de None (caminho exec_procedure do fdb): os
+                        # dois casos significam loja inexistente
+                        if (
+                            linha is None or linha[0] is None
+                        ) and validar_codigo_alfanumerico(codigo_normalizado):
+                            loja_info = self._buscar_loja_alfanumerica_flexivel(
+                                codigo_normalizado
+                            )
+                            if loja_info:
+                                cursor = self._exec(
+                                    _SQL_UPDATE_STATUS,
+                                    (novo_status, loja_info.codigo_loja),
+                                )
+                                linha = cursor.fetchone()
+
+                        atualizada = linha is not None and linha[0] is not None
+                        resultados[codigo_loja] = atualizada
+                        if atualizada:
+                            self._status_cache.pop(codigo_loja, None)
+                            self._status_cache.pop(codigo_normalizado, None)
+                            self._loja_cache.pop(codigo_normalizado, None)
+
+                    # Um único commit para o lote inteiro
+                    self.conexao.commit()
+                    self._leituras_desde_commit = 0
+                finally:
+                    self._transacao_em_lote = False
+
+            atualizadas = sum(1 for ok in resultados.values() if ok)
+            self.logger.info(
+                f"Lote de status atualizado: {atualizadas}/{len(resultados)} lojas"
+            )
+            return resultados
+
+        except fdb.DatabaseError as e:
+            self.logger.error(f"Erro de banco ao atualizar lote de lojas: {e}")
+            try:
+                with self._trava:
+                    if self.conexao:
+                        self.conexao.rollback()
+            except fdb.DatabaseError:
+                pass
+            return {codigo: False for codigo in codigos_lojas}
+        except Exception as e:
+            self.logger.error(f"Erro inesperado ao atualizar lote de lojas: {e}")
+            try:
+                with self._trava:
+                    if self.conexao:
+                        self.conexao.rollback()
+            except fdb.DatabaseError:
+                pass
+            return {codigo: False for codigo in codigos_lojas}
+
+    def iter_lojas_por_status(self, status: int):
+        """
+        Itera as lojas com um determinado status.
 
-                cursor.execute(sql, (status,))
-                resultados = cursor.fetchall()
+        As linhas são materializadas sob a trava da instância e entregues só
+        depois de liberá-la: segurar a trava através dos yields deixaria a
+        liberação a cargo da finalização do gerador quando o consumidor o
+        abandona — e um RLock finalizado pelo GC em outra thread não pode ser
+        liberado, travando todas as operações seguintes do gerenciador. A
+        leitura continua em blocos de 1000 linhas; o pico de memória passa a
+        ser O(N), como no fetchall.
 
-                lojas = []
-                for resultado in resultados:
-                    if len(resultado) >= 2:
-                        loja_info = {
-                            "codigo_loja": (
-                                str(resultado[0]).strip() if resultado[0] else "N/A"
-                            ),
-                            "id_status": (
-                                int(resultado[1]) if resultado[1] is not None else 0
+        Args:
+            status (int): Status para filtrar.
+
+        Yields:
+            LojaInfo: Uma loja por linha retornada.
+        """
+        # Aliases locais içados para fora do loop: evita recarregar os
+        # globais str/int/LojaInfo a cada linha processada
+        _str = str
+        _int = int
+        _loja_info = LojaInfo
+
+        lojas = []
+        with self._trava:
+            cursor = self._exec(_SQL_LISTAR_POR_STATUS, (status,))
+            cursor.arraysize = 1000
+            while True:
+                blocos = cursor.fetchmany(1000)
+                if not blocos:
+                    break
+                for codigo, id_status in blocos:
+                    lojas.append(
+                        _loja_info(
+                            codigo_loja=_str(codigo).strip() if codigo else "N/A",
+                            id_status=(
+                                _int(id_status) if id_status is not None else 0
                             ),
-                            "nome": "Nome não disponível",
-                        }
-                        lojas.append(loja_info)
+                        )
+                    )
 
-                self.logger.info(f"Encontradas {len(lojas)} lojas com status {status}")
-                return lojas
+        yield from lojas
+
+    @log_operacao
+    def listar_lojas_por_status(self, status: int) -> List[LojaInfo]:
+        """
+        Lista todas as lojas com um determinado status.
+
+        Args:
+            status (int): Status para filtrar.
+
+        Returns:
+            List[LojaInfo]: Lista de lojas com o status especificado.
+        """
+        try:
+            self.logger.info(f"Listando lojas com status {status}...")
+
+            lojas = list(self.iter_lojas_por_status(status))
+
+            self.logger.info(f"Encontradas {len(lojas)} lojas com status {status}")
+            return lojas
 
         except fdb.DatabaseError as e:
             self.logger.error(f"Erro de banco ao listar lojas por status {status}: {e}")
@@ -457,9 +907,21 @@ class FirebirdManager(LoggerMixin):
             Optional[int]: Status atual da loja ou None se não encontrada.
         """
         try:
+            # Consultas repetidas da mesma loja dentro do TTL saem do cache
+            entrada = self._status_cache.get(codigo_loja)
+            if entrada is not None:
+                status, momento = entrada
+                if time.monotonic() - momento < self._TTL_STATUS_CACHE:
+                    return status
+                del self._status_cache[codigo_loja]
+
             loja_info = self.buscar_loja_por_codigo(codigo_loja)
             if loja_info:
-                return loja_info["id_status"]
+                self._status_cache[codigo_loja] = (
+                    loja_info.id_status,
+                    time.monotonic(),
+                )
+                return loja_info.id_status
             return None
 
         except Exception as e:
@@ -499,38 +961,27 @@ class FirebirdManager(LoggerMixin):
             Dict: Estatísticas da tabela.
         """
         try:
-            with self.obter_cursor() as cursor:
-                # Total de lojas
-                cursor.execute("SELECT COUNT(*) FROM TB_LOJA")
-                resultado_total = cursor.fetchone()
-                total_lojas = resultado_total[0] if resultado_total else 0
-
-                # Lojas por status
-                cursor.execute(
-                    """
-                    SELECT ID_STATUS, COUNT(*) 
-                    FROM TB_LOJA 
-                    GROUP BY ID_STATUS 
-                    ORDER BY ID_STATUS
-                """
-                )
-                resultados_status = cursor.fetchall()
-                lojas_por_status = {}
-
-                for resultado in resultados_status:
-                    if len(resultado) >= 2:
-                        status = int(resultado[0]) if resultado[0] is not None else 0
-                        count = int(resultado[1]) if resultado[1] is not None else 0
-                        lojas_por_status[status] = count
-
-                estatisticas = {
-                    "total_lojas": total_lojas,
-                    "lojas_por_status": lojas_por_status,
-                    "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            # Um único GROUP BY: o total é a soma das contagens, dispensando o
+            # COUNT(*) separado (que no Firebird varre a tabela inteira)
+            with self._trava:
+                cursor = self._exec(_SQL_ESTATISTICAS)
+
+                # Itera direto sobre o cursor: dispensa a lista intermediária
+                # do fetchall (uma linha por status existente na tabela)
+                lojas_por_status = {
+                    int(status or 0): int(count or 0) for status, count in cursor
                 }
+            total_lojas = sum(lojas_por_status.values())
 
-                self.logger.info(f"Estatísticas da tabela TB_LOJA: {estatisticas}")
-                return estatisticas
+            estatisticas = {
+                "total_lojas": total_lojas,
+                "lojas_por_status": lojas_por_status,
+                # isoformat não reinterpreta string de formato a cada chamada
+                "timestamp": datetime.now().isoformat(sep=" ", timespec="seconds"),
+            }
+
+            self.logger.info(f"Estatísticas da tabela TB_LOJA: {estatisticas}")
+            return estatisticas
 
         except Exception as e:
             self.logger.error(f"Erro ao obter estatísticas da tabela: {e}")
@@ -539,14 +990,43 @@ class FirebirdManager(LoggerMixin):
     def desconectar(self):
         """Fecha a conexão com o banco Firebird."""
         try:
-            if self.conexao:
-                self.conexao.close()
-                self.conexao = None
-                self.conectado = False
-                self.logger.info("Desconectado do Firebird")
+            with self._trava:
+                self._desconectar_travado()
         except Exception as e:
             self.logger.warning(f"Erro ao desconectar do Firebird: {e}")
 
-    def __del__(self):
-        """Destrutor para garantir que a conexão seja fechada."""
+    def _desconectar_travado(self):
+        """Corpo de desconectar, executado sob a trava da instância."""
+        if self.conexao:
+            self._ps_cache.clear()
+            self._status_cache.clear()
+            self._loja_cache.clear()
+            if self._cursor:
+                self._cursor.close()
+                self._cursor = None
+            if self._finalizer is not None:
+                self._finalizer.detach()
+                self._finalizer = None
+            self.conexao.close()
+            self.conexao = None
+            self.conectado = False
+            self.logger.info("Desconectado do Firebird")
+
+    def __enter__(self) -> "FirebirdManager":
+        """
+        Entra no contexto conectando ao banco se necessário.
+
+        Permite ``with FirebirdManager() as fb:`` com desconexão garantida
+        no fim do bloco, sem depender do finalizer de coleta de lixo.
+
+        Returns:
+            FirebirdManager: O próprio gerenciador.
+        """
+        if not self.conectado:
+            self.conectar()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Sai do contexto desconectando do banco."""
         self.desconectar()
+        return False
@@ -3,6 +3,14 @@ Módulo para integração com Google Sheets API.
 ATUALIZADO: Removido método limpar_colunas_gerenciador
 """
 
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import gspread
 from google.auth.exceptions import GoogleAuthError
 from gspread.exceptions import APIError, SpreadsheetNotFound, WorksheetNotFound
@@ -13,7 +21,6 @@ from logger.Logger import LoggerMixin, log_operacao
 from utils.Utils import (
     limpar_texto,
     normalizar_tipo_numero_loja,
-    comparar_numeros_loja,
     safe_int,
     validar_codigo_alfanumerico,
     comparar_codigos_flexivel,
@@ -21,15 +28,173 @@ from utils.Utils import (
 )
 
 
+# Padrão de código alfanumérico (letras + dígitos), compilado uma vez
+_RE_ALFANUM = re.compile(r"^([A-Z]+)([0-9]+)$")
+
+
+def _requisicao_valor_celula(aba_id: int, linha: int, coluna: int, valor: Any) -> dict:
+    """
+    Monta uma requisição updateCells para uma célula, no formato aceito por
+    ``spreadsheets.batchUpdate``.
+
+    Args:
+        aba_id (int): ID da aba (sheetId).
+        linha (int): Linha da célula (baseada em 1).
+        coluna (int): Coluna da célula (baseada em 1).
+        valor: Valor a escrever na célula.
+
+    Returns:
+        dict: Requisição updateCells.
+    """
+    return {
+        "updateCells": {
+            "start": {
+                "sheetId": aba_id,
+                "rowIndex": linha - 1,
+                "columnIndex": coluna - 1,
+            },
+            "rows": [{"values": [{"userEnteredValue": {"stringValue": str(valor)}}]}],
+            "fields": "userEnteredValue",
+        }
+    }
+
+
+def _requisicao_formato_linha(
+    aba_id: int, linha: int, coluna_inicio: int, coluna_fim: int, formato: dict
+) -> dict:
+    """
+    Monta uma requisição repeatCell aplicando um formato em um trecho de linha.
+
+    Args:
+        aba_id (int): ID da aba (sheetId).
+        linha (int): Linha a formatar (baseada em 1).
+        coluna_inicio (int): Primeira coluna do trecho (baseada em 1).
+        coluna_fim (int): Última coluna do trecho (baseada em 1, inclusiva).
+        formato (dict): Formato de célula (userEnteredFormat).
+
+    Returns:
+        dict: Requisição repeatCell.
+    """
+    return {
+        "repeatCell": {
+            "range": {
+                "sheetId": aba_id,
+                "startRowIndex": linha - 1,
+                "endRowIndex": linha,
+                "startColumnIndex": coluna_inicio - 1,
+                "endColumnIndex": coluna_fim,
+            },
+            "cell": {"userEnteredFormat": formato},
+            "fields": "userEnteredFormat(" + ",".join(formato) + ")",
+        }
+    }
+
+
+def _chave_flexivel(codigo: str) -> Optional[str]:
+    """
+    Chave canônica para comparação flexível de códigos alfanuméricos
+    (I5 e I05 produzem a mesma chave "I5").
+
+    Args:
+        codigo (str): Código já normalizado.
+
+    Returns:
+        Optional[str]: Chave canônica ou None se o código não é alfanumérico.
+    """
+    match = _RE_ALFANUM.match(codigo.upper())
+    if not match:
+        return None
+    letras, numeros = match.groups()
+    return f"{letras}{int(numeros)}"
+
+
+# Formato laranja aplicado na linha da aba Gerenciador ao fechar uma loja
+FORMATO_LARANJA = {
+    "backgroundColor": {
+        "red": 1.0,  # 255/255
+        "green": 0.647,  # 165/255
+        "blue": 0.0,  # 0/255
+        # Resultado: #FFA500 (laranja)
+    }
+}
+
+# Formatação específica para linhas da aba Lojas Fechadas
+FORMATACAO_LOJAS_FECHADAS = {
+    "backgroundColor": {
+        "red": 0.863,  # 220/255 = 0.863 (DC)
+        "green": 0.941,  # 240/255 = 0.941 (F0)
+        "blue": 0.776,  # 198/255 = 0.776 (C6)
+        # Resultado: #DCF0C6 (verde claro)
+    },
+    "horizontalAlignment": "CENTER",
+    "verticalAlignment": "MIDDLE",
+    "borders": {
+        "top": {
+            "style": "SOLID",
+            "width": 1,
+            "color": {"red": 0.0, "green": 0.0, "blue": 0.0},
+        },
+        "bottom": {
+            "style": "SOLID",
+            "width": 1,
+            "color": {"red": 0.0, "green": 0.0, "blue": 0.0},
+        },
+        "left": {
+            "style": "SOLID",
+            "width": 1,
+            "color": {"red": 0.0, "green": 0.0, "blue": 0.0},
+        },
+        "right": {
+            "style": "SOLID",
+            "width": 1,
+            "color": {"red": 0.0, "green": 0.0, "blue": 0.0},
+        },
+    },
+}
+
+
 class GoogleSheetsManager(LoggerMixin):
     """Classe para gerenciar operações com Google Sheets."""
 
+    # Conjunto fixo de atributos: dispensa o __dict__ por instância e torna o
+    # acesso a atributo um offset direto
+    __slots__ = (
+        "config",
+        "cliente",
+        "planilha",
+        "conectado",
+        "_indice_gerenciador",
+        "_indice_coluna_gerenciador",
+        "_coluna_bruta_gerenciador",
+        "_cache_linha",
+        "_proxima_linha_fechadas",
+        "_abas",
+    )
+
     def __init__(self):
         """Inicializa o gerenciador do Google Sheets."""
         self.config = ConfigManager()
         self.cliente = None
         self.planilha = None
         self.conectado = False
+        # Índice número da loja -> dados da linha, montado uma vez por sessão
+        self._indice_gerenciador = None
+        # Índice número normalizado -> linha da coluna de códigos, montado na
+        # primeira busca e reutilizado nas seguintes
+        self._indice_coluna_gerenciador = None
+        # Valores crus da coluna de códigos, baixados uma vez por sessão; a
+        # primeira busca faz varredura com saída antecipada e o índice completo
+        # só é montado se houver mais buscas (ou fallback flexível)
+        self._coluna_bruta_gerenciador = None
+        # Memo de buscas já resolvidas (inclusive as sem resultado): repetir a
+        # busca da mesma loja na sessão vira um acesso de dicionário
+        self._cache_linha: Dict[str, Optional[int]] = {}
+        # Próxima linha vazia conhecida da aba Lojas Fechadas, mantida pelas
+        # próprias escritas para evitar rebaixar a coluna de nomes
+        self._proxima_linha_fechadas: Optional[int] = None
+        # Handles de Worksheet memoizados por nome: cada resolução via
+        # planilha.worksheet() varre os metadados da planilha
+        self._abas: Dict[str, Any] = {}
 
     @log_operacao
     def conectar(self) -> bool:
@@ -47,10 +212,23 @@ class GoogleSheetsManager(LoggerMixin):
                 filename=self.config.arquivo_credenciais
             )
 
+            # Amplia o pool de conexões keep-alive da sessão HTTP
+            self._ajustar_sessao_http()
+
             # Abre a planilha
             self.planilha = self.cliente.open_by_key(self.config.planilha_id)
 
             self.conectado = True
+
+            # Pré-carrega os dados da sessão (snapshot em disco ou um único
+            # values_batch_get): os fluxos seguintes encontram os caches já
+            # populados em vez de pagar um GET por coluna. É apenas
+            # otimização — se falhar, cada caminho lê sob demanda como antes
+            if not self.precarregar_dados_sessao():
+                self.logger.debug(
+                    "Pré-carga da sessão indisponível; leituras sob demanda"
+                )
+
             self.logger.info("Conexão estabelecida com sucesso!")
             return True
 
@@ -71,6 +249,63 @@ class GoogleSheetsManager(LoggerMixin):
             self.logger.error(f"Erro inesperado ao conectar: {e}")
             return False
 
+    def _ajustar_sessao_http(self):
+        """
+        Amplia o pool de conexões da sessão HTTP usada pelo gspread.
+
+        A sessão do requests já mantém keep-alive (evita novo handshake TLS a
+        cada chamada), mas o pool padrão limita quantas conexões ficam vivas
+        quando as operações rodam em paralelo (teste de conexões, modo batch).
+        """
+        try:
+            from requests.adapters import HTTPAdapter
+
+            # gspread >= 5.12 expõe a sessão via http_client; versões
+            # anteriores diretamente em .session
+            sessao = getattr(
+                getattr(self.cliente, "http_client", self.cliente), "session", None
+            )
+            if sessao is None:
+                return
+
+            adaptador = HTTPAdapter(pool_connections=8, pool_maxsize=8)
+            sessao.mount("https://", adaptador)
+        except Exception as e:
+            # Ajuste de transporte é oportunista: segue com a sessão padrão
+            self.logger.debug("Não foi possível ajustar a sessão HTTP: %s", e)
+
+    def _chamada_com_backoff(self, funcao, *args, **kwargs):
+        """
+        Executa uma chamada à API com backoff apenas quando há rate limit.
+
+        A cota do Sheets é um token bucket: em vez de esperas incondicionais,
+        só dorme (exponencialmente, até 30s) quando a API devolve 429, e
+        propaga qualquer outro erro imediatamente.
+
+        Args:
+            funcao: Chamada da API a executar.
+            *args: Argumentos posicionais da chamada.
+            **kwargs: Argumentos nomeados da chamada.
+
+        Returns:
+            O retorno da chamada.
+        """
+        tentativa = 0
+        while True:
+            try:
+                return funcao(*args, **kwargs)
+            except APIError as e:
+                codigo = getattr(getattr(e, "response", None), "status_code", None)
+                if codigo != 429 or tentativa >= 5:
+                    raise
+                espera = min(2**tentativa, 30)
+                self.logger.warning(
+                    "Cota da API excedida (429); aguardando %ds antes de repetir",
+                    espera,
+                )
+                time.sleep(espera)
+                tentativa += 1
+
     def obter_aba(self, nome_aba: str):
         """
         Obtém uma aba específica da planilha.
@@ -85,9 +320,15 @@ class GoogleSheetsManager(LoggerMixin):
             self.logger.error("Não conectado ao Google Sheets")
             return None
 
+        # Handle já resolvido nesta sessão: devolve sem tocar na API
+        aba_cacheada = self._abas.get(nome_aba)
+        if aba_cacheada is not None:
+            return aba_cacheada
+
         try:
             aba = self.planilha.worksheet(nome_aba)
-            self.logger.debug(f"Aba '{nome_aba}' obtida com sucesso")
+            self._abas[nome_aba] = aba
+            self.logger.debug("Aba '%s' obtida com sucesso", nome_aba)
             return aba
         except WorksheetNotFound:
             self.logger.error(f"Aba '{nome_aba}' não encontrada")
@@ -107,120 +348,357 @@ class GoogleSheetsManager(LoggerMixin):
             Optional[int]: Número da linha onde a loja foi encontrada ou None.
         """
         try:
-            aba = self.obter_aba(self.config.aba_gerenciador)
-            if not aba:
-                return None
+            # Normaliza o número da loja procurado
+            numero_loja_normalizado = normalizar_tipo_numero_loja(numero_loja)
+
+            # Busca já resolvida nesta sessão (achado ou não): devolve o memo
+            if numero_loja_normalizado in self._cache_linha:
+                return self._cache_linha[numero_loja_normalizado]
 
             self.logger.info(f"Buscando loja {numero_loja} na aba Gerenciador...")
 
-            # Converte letra da coluna para número
-            coluna_letra = self.config.coluna_numero_loja_gerenciador  # "C"
-            coluna_numero = converter_letra_coluna_para_numero(coluna_letra)  # 3
+            # Primeira busca da sessão: varredura com saída antecipada sobre a
+            # coluna já baixada, sem pagar a montagem do índice inteiro quando
+            # o acerto está no começo (ou só haverá uma busca)
+            if self._indice_coluna_gerenciador is None:
+                coluna_valores = self._obter_coluna_gerenciador()
+                if coluna_valores is None:
+                    return None
 
-            self.logger.debug(
-                f"Coluna configurada: '{coluna_letra}' -> número {coluna_numero}"
-            )
+                linha_inicio_int = max(
+                    safe_int(self.config.linha_inicio_gerenciador, 6), 1
+                )
+                linha = next(
+                    (
+                        linha_planilha
+                        for linha_planilha, valor_celula in enumerate(
+                            coluna_valores[linha_inicio_int - 1 :],
+                            start=linha_inicio_int,
+                        )
+                        if normalizar_tipo_numero_loja(valor_celula)
+                        == numero_loja_normalizado
+                    ),
+                    None,
+                )
+                if linha is not None:
+                    self.logger.info(
+                        f"Loja {numero_loja} encontrada na linha {linha} "
+                        f"(comparação exata)"
+                    )
+                    self._cache_linha[numero_loja_normalizado] = linha
+                    return linha
 
-            # Obtém todos os valores da coluna C usando o número da coluna
-            coluna_valores = aba.col_values(
-                coluna_numero,
-                value_render_option="UNFORMATTED_VALUE",
-            )
+            # Sem acerto antecipado (ou buscas repetidas): usa o índice; a
+            # coluna já está em memória, então montar é só trabalho de CPU
+            indices = self._obter_indice_coluna_gerenciador()
+            if indices is None:
+                return None
+            indice_exato, indice_flexivel = indices
 
-            # Normaliza o número da loja procurado
-            numero_loja_normalizado = normalizar_tipo_numero_loja(numero_loja)
+            linha = indice_exato.get(numero_loja_normalizado)
+            if linha is not None:
+                self.logger.info(
+                    f"Loja {numero_loja} encontrada na linha {linha} (comparação exata)"
+                )
+                self._cache_linha[numero_loja_normalizado] = linha
+                return linha
+
+            # Para códigos alfanuméricos, tenta a chave canônica (I5 == I05)
+            if validar_codigo_alfanumerico(numero_loja_normalizado):
+                chave = _chave_flexivel(numero_loja_normalizado)
+                linha = indice_flexivel.get(chave) if chave else None
+                if linha is not None:
+                    self.logger.info(
+                        f"Loja {numero_loja} encontrada na linha {linha} (comparação flexível)"
+                    )
+                    self._cache_linha[numero_loja_normalizado] = linha
+                    return linha
 
-            # Converte linha_inicio para int ANTES de usar
-            linha_inicio_raw = self.config.linha_inicio_gerenciador
-            linha_inicio = safe_int(linha_inicio_raw, 6)
+            self.logger.warning(f"Loja {numero_loja} não encontrada na aba Gerenciador")
+            self._cache_linha[numero_loja_normalizado] = None
+            return None
 
-            self.logger.debug(
-                f"Procurando loja normalizada: '{numero_loja_normalizado}'"
+        except APIError as e:
+            self.logger.error(f"Erro da API ao buscar loja: {e}")
+            return None
+        except Exception:
+            # exception() só formata o traceback se o handler estiver ativo
+            self.logger.exception("Erro inesperado ao buscar loja")
+            return None
+
+    def buscar_varias_lojas(self, numeros_lojas: list) -> Dict[str, Optional[int]]:
+        """
+        Busca as linhas de várias lojas na aba Gerenciador.
+
+        A primeira busca popula o índice da coluna (um único download); as
+        demais resolvem em memória — por isso um laço simples supera um pool
+        de threads, que só pagaria overhead para acessos de dicionário.
+
+        Args:
+            numeros_lojas (list): Lista de números de lojas.
+
+        Returns:
+            Dict[str, Optional[int]]: Linha encontrada por número da loja
+                (None para lojas não encontradas).
+        """
+        # Garante o índice completo antes do laço: com várias lojas, a
+        # varredura com saída antecipada deixaria de compensar
+        self._obter_indice_coluna_gerenciador()
+
+        return {
+            numero_loja: self.buscar_numero_loja_na_aba_gerenciador(numero_loja)
+            for numero_loja in numeros_lojas
+        }
+
+    def _obter_indice_coluna_gerenciador(self):
+        """
+        Monta o índice da coluna de códigos da aba Gerenciador.
+
+        Lê a coluna configurada uma única vez e constrói dois dicionários:
+        código normalizado -> linha (busca exata) e chave canônica -> linha
+        (busca flexível para códigos alfanuméricos). O resultado fica em cache
+        na instância e é reaproveitado pelas buscas seguintes da sessão.
+
+        Returns:
+            Optional[tuple]: Tupla (indice_exato, indice_flexivel) ou None em
+                caso de erro ao ler a aba.
+        """
+        if self._indice_coluna_gerenciador is not None:
+            return self._indice_coluna_gerenciador
+
+        coluna_valores = self._obter_coluna_gerenciador()
+        if coluna_valores is None:
+            return None
+
+        self._indice_coluna_gerenciador = self._montar_indices_coluna(coluna_valores)
+        return self._indice_coluna_gerenciador
+
+    def _obter_coluna_gerenciador(self) -> Optional[list]:
+        """
+        Obtém (e guarda) os valores crus da coluna de códigos do Gerenciador.
+
+        Returns:
+            Optional[list]: Valores da coluna a partir da linha 1, ou None em
+                caso de erro ao ler a aba.
+        """
+        if self._coluna_bruta_gerenciador is not None:
+            return self._coluna_bruta_gerenciador
+
+        aba = self.obter_aba(self.config.aba_gerenciador)
+        if not aba:
+            return None
+
+        # Obtém todos os valores da coluna usando o número já pré-convertido
+        self._coluna_bruta_gerenciador = aba.col_values(
+            self.config.coluna_numero_loja_gerenciador_num,  # "C" -> 3
+            value_render_option="UNFORMATTED_VALUE",
+        )
+        return self._coluna_bruta_gerenciador
+
+    def _montar_indices_coluna(self, coluna_valores: list) -> tuple:
+        """
+        Constrói os dicionários de busca a partir dos valores da coluna.
+
+        Args:
+            coluna_valores (list): Valores da coluna de códigos, a partir da
+                linha 1.
+
+        Returns:
+            tuple: Tupla (indice_exato, indice_flexivel).
+        """
+        # Convertido uma única vez, fora do laço
+        linha_inicio_int = max(safe_int(self.config.linha_inicio_gerenciador, 6), 1)
+
+        # O fatiamento descarta as linhas de cabeçalho antes do laço: o corpo
+        # fica linear, sem comparação por linha. A primeira ocorrência de cada
+        # código prevalece, como na varredura original
+        indice_exato = {}
+        indice_flexivel = {}
+        for linha_planilha, valor_celula in enumerate(
+            coluna_valores[linha_inicio_int - 1 :], start=linha_inicio_int
+        ):
+            valor_normalizado = normalizar_tipo_numero_loja(valor_celula)
+            if not valor_normalizado:
+                continue
+
+            indice_exato.setdefault(valor_normalizado, linha_planilha)
+
+            chave = _chave_flexivel(valor_normalizado)
+            if chave:
+                indice_flexivel.setdefault(chave, linha_planilha)
+
+        self.logger.debug(
+            "Índice da coluna Gerenciador montado com %d códigos", len(indice_exato)
+        )
+
+        return (indice_exato, indice_flexivel)
+
+    def precarregar_dados_sessao(self) -> bool:
+        """
+        Pré-carrega em uma única chamada os dados usados pelo fluxo de
+        fechamento: a coluna de códigos do Gerenciador e a coluna de nomes de
+        Lojas Fechadas (para a próxima linha vazia).
+
+        Um values_batch_get cobre as duas abas em um único round-trip, em vez
+        de um GET por coluna quando cada caminho precisa dela.
+
+        Returns:
+            bool: True se os caches foram populados, False caso contrário.
+        """
+        try:
+            if not self.conectado:
+                self.logger.error("Não conectado ao Google Sheets")
+                return False
+
+            # Entre execuções a planilha raramente muda: uma consulta de
+            # metadados ao Drive (modifiedTime) decide se o snapshot em disco
+            # da execução anterior ainda vale, dispensando a leitura de dados
+            momento_remoto = self._obter_momento_modificacao()
+            if momento_remoto:
+                snapshot = self._carregar_snapshot(momento_remoto)
+                if snapshot is not None:
+                    coluna_valores, proxima_linha = snapshot
+                    self._coluna_bruta_gerenciador = coluna_valores
+                    self._indice_coluna_gerenciador = self._montar_indices_coluna(
+                        coluna_valores
+                    )
+                    self._proxima_linha_fechadas = proxima_linha
+                    self.logger.info(
+                        "Dados da sessão reaproveitados do snapshot em disco"
+                    )
+                    return True
+
+            coluna_gerenciador = self.config.coluna_numero_loja_gerenciador  # "C"
+            coluna_fechadas = self.config.coluna_nome_loja_fechadas  # "B"
+
+            resposta = self.planilha.values_batch_get(
+                [
+                    f"'{self.config.aba_gerenciador}'!"
+                    f"{coluna_gerenciador}1:{coluna_gerenciador}",
+                    f"'{self.config.aba_lojas_fechadas}'!"
+                    f"{coluna_fechadas}1:{coluna_fechadas}",
+                ],
+                params={"valueRenderOption": "UNFORMATTED_VALUE"},
             )
-            self.logger.debug(
-                f"Linha de início: {linha_inicio} (convertido de {linha_inicio_raw}, tipo original: {type(linha_inicio_raw)})"
+            faixas = resposta.get("valueRanges", [])
+            if len(faixas) != 2:
+                return False
+
+            # Cada faixa vem como lista de linhas com até uma célula cada
+            coluna_valores, coluna_nomes = (
+                [linha[0] if linha else "" for linha in faixa.get("values", [])]
+                for faixa in faixas
             )
 
-            # Identifica se é código alfanumérico para busca especializada
-            eh_codigo_alfanumerico = validar_codigo_alfanumerico(
-                numero_loja_normalizado
+            self._coluna_bruta_gerenciador = coluna_valores
+            self._indice_coluna_gerenciador = self._montar_indices_coluna(
+                coluna_valores
             )
-            if eh_codigo_alfanumerico:
-                self.logger.debug(
-                    f"Detectado código alfanumérico: {numero_loja_normalizado}"
+            self._proxima_linha_fechadas = len(coluna_nomes) + 1
+
+            # Guarda o snapshot para a próxima execução do processo
+            if momento_remoto:
+                self._gravar_snapshot(
+                    momento_remoto, coluna_valores, self._proxima_linha_fechadas
                 )
 
-            # Busca o número da loja com comparações seguras
-            for indice_lista, valor_celula in enumerate(coluna_valores):
-                # IMPORTANTE: indice_lista é baseado em 0, mas linha da planilha é baseada em 1
-                linha_planilha = indice_lista + 1
+            self.logger.info("Dados da sessão pré-carregados em uma única chamada")
+            return True
 
-                # Garante que ambas as variáveis sejam int antes da comparação
-                linha_planilha_int = safe_int(linha_planilha, 0)
-                linha_inicio_int = safe_int(linha_inicio, 6)
+        except APIError as e:
+            self.logger.error(f"Erro da API ao pré-carregar dados da sessão: {e}")
+            return False
+        except Exception as e:
+            self.logger.error(f"Erro inesperado ao pré-carregar dados da sessão: {e}")
+            return False
 
-                self.logger.debug(
-                    f"Comparando linhas: linha_planilha_int={linha_planilha_int} >= linha_inicio_int={linha_inicio_int}"
-                )
+    def _caminho_snapshot(self) -> str:
+        """Caminho do snapshot em disco, separado por planilha."""
+        return os.path.join(
+            tempfile.gettempdir(),
+            f"fechamento_snapshot_{self.config.planilha_id}.json",
+        )
 
-                # Só considera linhas a partir da linha configurada
-                if linha_planilha_int >= linha_inicio_int:
-                    # Normaliza o valor da planilha para comparação segura
-                    valor_normalizado = normalizar_tipo_numero_loja(valor_celula)
+    def _obter_momento_modificacao(self) -> Optional[str]:
+        """
+        Consulta o modifiedTime da planilha na API do Drive.
 
-                    self.logger.debug(
-                        f"Linha {linha_planilha_int}: valor_original='{valor_celula}' (tipo:{type(valor_celula)}) -> valor_normalizado='{valor_normalizado}'"
-                    )
+        É uma chamada só de metadados (fields=modifiedTime), muito mais
+        barata que reler as colunas quando nada mudou.
 
-                    # Usa a função de comparação segura
-                    if comparar_numeros_loja(
-                        valor_normalizado, numero_loja_normalizado
-                    ):
-                        self.logger.info(
-                            f"Loja {numero_loja} encontrada na linha {linha_planilha_int} (comparação exata)"
-                        )
-                        return linha_planilha_int
-
-                    # Para códigos alfanuméricos, tenta busca flexível adicional
-                    if eh_codigo_alfanumerico and validar_codigo_alfanumerico(
-                        valor_normalizado
-                    ):
-                        if comparar_codigos_flexivel(
-                            valor_normalizado, numero_loja_normalizado
-                        ):
-                            self.logger.info(
-                                f"Loja {numero_loja} encontrada na linha {linha_planilha_int} (comparação flexível: {valor_normalizado} ≈ {numero_loja_normalizado})"
-                            )
-                            return linha_planilha_int
+        Returns:
+            Optional[str]: Timestamp de modificação ou None se indisponível.
+        """
+        try:
+            cliente_http = getattr(self.cliente, "http_client", self.cliente)
+            resposta = cliente_http.request(
+                "get",
+                "https://www.googleapis.com/drive/v3/files/"
+                f"{self.config.planilha_id}",
+                params={"fields": "modifiedTime"},
+            )
+            return resposta.json().get("modifiedTime")
+        except Exception as e:
+            # Sem o metadado o fluxo apenas relê os dados normalmente
+            self.logger.debug("Não foi possível obter o modifiedTime: %s", e)
+            return None
 
-            self.logger.warning(f"Loja {numero_loja} não encontrada na aba Gerenciador")
+    def _carregar_snapshot(self, momento_remoto: str) -> Optional[tuple]:
+        """
+        Carrega o snapshot em disco se ele corresponde ao momento remoto.
 
-            # Log adicional para debug
-            if eh_codigo_alfanumerico:
-                self.logger.debug(
-                    f"Busca para código alfanumérico '{numero_loja_normalizado}' não encontrou correspondência"
-                )
+        O snapshot é JSON puro: como o arquivo fica no diretório temporário
+        (gravável por qualquer usuário da máquina), desserializar um formato
+        que só carrega dados — nunca código — evita que um arquivo adulterado
+        vire execução arbitrária, e conteúdo malformado apenas invalida o
+        cache.
 
-            # Debug: mostra alguns valores encontrados na coluna
-            self.logger.debug("Primeiros valores encontrados na coluna (para debug):")
-            for i, val in enumerate(coluna_valores[:5]):
-                val_norm = normalizar_tipo_numero_loja(val)
-                linha_real = i + 1
-                if linha_real >= linha_inicio_int:
-                    self.logger.debug(f"  Linha {linha_real}: '{val}' -> '{val_norm}'")
+        Args:
+            momento_remoto (str): modifiedTime atual da planilha.
 
+        Returns:
+            Optional[tuple]: (coluna_gerenciador, proxima_linha_fechadas) ou
+                None se o snapshot não existe ou está desatualizado.
+        """
+        try:
+            with open(self._caminho_snapshot(), "r", encoding="utf-8") as arquivo:
+                dados = json.load(arquivo)
+            if dados.get("modified_time") != momento_remoto:
+                return None
+            coluna_valores = dados["coluna_gerenciador"]
+            proxima_linha = dados["proxima_linha_fechadas"]
+            if not isinstance(coluna_valores, list) or not isinstance(
+                proxima_linha, int
+            ):
+                return None
+            return coluna_valores, proxima_linha
+        except (OSError, ValueError, KeyError, AttributeError):
             return None
 
-        except APIError as e:
-            self.logger.error(f"Erro da API ao buscar loja: {e}")
-            return None
-        except Exception as e:
-            self.logger.error(f"Erro inesperado ao buscar loja: {e}")
-            # Log adicional para debug do erro específico
-            import traceback
+    def _gravar_snapshot(
+        self, momento_remoto: str, coluna_valores: list, proxima_linha: int
+    ):
+        """
+        Grava o snapshot da sessão em disco para a próxima execução.
 
-            self.logger.error(f"Traceback completo: {traceback.format_exc()}")
-            return None
+        Args:
+            momento_remoto (str): modifiedTime da planilha no momento da leitura.
+            coluna_valores (list): Coluna de códigos da aba Gerenciador.
+            proxima_linha (int): Próxima linha vazia de Lojas Fechadas.
+        """
+        try:
+            with open(self._caminho_snapshot(), "w", encoding="utf-8") as arquivo:
+                json.dump(
+                    {
+                        "modified_time": momento_remoto,
+                        "coluna_gerenciador": coluna_valores,
+                        "proxima_linha_fechadas": proxima_linha,
+                    },
+                    arquivo,
+                )
+        except (OSError, TypeError, ValueError) as e:
+            # Snapshot é só otimização: falha de disco não afeta a operação
+            self.logger.debug("Não foi possível gravar o snapshot: %s", e)
 
     def obter_informacoes_completas_loja(
         self, numero_loja: str
@@ -235,60 +713,37 @@ class GoogleSheetsManager(LoggerMixin):
             Optional[Dict]: Dicionário com informações da loja ou None se não encontrada.
         """
         try:
-            linha = self.buscar_numero_loja_na_aba_gerenciador(numero_loja)
-            if linha is None:
-                return None
-
-            aba = self.obter_aba(self.config.aba_gerenciador)
-            if not aba:
-                return None
-
-            # Garante que linha seja inteiro
-            linha_int = safe_int(linha, 0)
-            if linha_int <= 0:
-                self.logger.error(f"Linha inválida: {linha}")
+            # O índice da sessão já carrega as colunas A até I de uma vez e é
+            # invalidado pelas escritas: nenhuma chamada extra por loja
+            entrada = self.obter_entrada_indice_gerenciador(numero_loja)
+            if entrada is None:
                 return None
 
-            # Obtém informações das colunas específicas
-            try:
-                # Coluna B - Grupo
-                grupo = aba.cell(linha_int, 2).value  # Coluna B = 2
-                grupo = limpar_texto(grupo) if grupo else "Não informado"
-
-                # Coluna G - Nome da loja
-                nome_loja = aba.cell(linha_int, 7).value  # Coluna G = 7
-                nome_loja = (
-                    limpar_texto(nome_loja) if nome_loja else "Nome não encontrado"
-                )
-
-                # Coluna D - Status Principal
-                status_d = aba.cell(linha_int, 4).value  # Coluna D = 4
-                status_d = limpar_texto(status_d) if status_d else "Não informado"
-
-                # Coluna I - Status Secundário
-                status_i = aba.cell(linha_int, 9).value  # Coluna I = 9
-                status_i = limpar_texto(status_i) if status_i else "Não informado"
+            linha_int = entrada["linha"]
+            grupo = entrada["grupo"]
+            nome_loja = entrada["nome_loja"]
+            status_d = entrada["status_d"]
+            status_i = entrada["status_i"]
 
+            if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(
-                    f"Informações obtidas para loja {numero_loja} na linha {linha_int}"
+                    "Informações obtidas para loja %s na linha %d",
+                    numero_loja,
+                    linha_int,
                 )
-                self.logger.debug(f"  Grupo (B): '{grupo}'")
-                self.logger.debug(f"  Nome (G): '{nome_loja}'")
-                self.logger.debug(f"  Status D: '{status_d}'")
-                self.logger.debug(f"  Status I: '{status_i}'")
-
-                return {
-                    "numero_loja": numero_loja,
-                    "linha_gerenciador": linha_int,
-                    "grupo": grupo,
-                    "nome_loja": nome_loja,
-                    "status_d": status_d,
-                    "status_i": status_i,
-                }
-
-            except Exception as e:
-                self.logger.error(f"Erro ao obter células da linha {linha_int}: {e}")
-                return None
+                self.logger.debug("  Grupo (B): '%s'", grupo)
+                self.logger.debug("  Nome (G): '%s'", nome_loja)
+                self.logger.debug("  Status D: '%s'", status_d)
+                self.logger.debug("  Status I: '%s'", status_i)
+
+            return {
+                "numero_loja": numero_loja,
+                "linha_gerenciador": linha_int,
+                "grupo": grupo,
+                "nome_loja": nome_loja,
+                "status_d": status_d,
+                "status_i": status_i,
+            }
 
         except Exception as e:
             self.logger.error(
@@ -307,23 +762,11 @@ class GoogleSheetsManager(LoggerMixin):
             Optional[str]: Nome da loja ou None se não encontrada.
         """
         try:
-            linha = self.buscar_numero_loja_na_aba_gerenciador(numero_loja)
-            if linha is None:
-                return None
-
-            aba = self.obter_aba(self.config.aba_gerenciador)
-            if not aba:
-                return None
-
-            # Garante que linha seja inteiro
-            linha_int = safe_int(linha, 0)
-            if linha_int <= 0:
-                self.logger.error(f"Linha inválida: {linha}")
+            # Nome (coluna G) já está no índice da sessão: sem aba.cell()
+            entrada = self.obter_entrada_indice_gerenciador(numero_loja)
+            if entrada is None:
                 return None
-
-            # Nome está na coluna G (7)
-            nome = aba.cell(linha_int, 7).value  # Coluna G = 7
-            return limpar_texto(nome) if nome else "Nome não encontrado"
+            return entrada["nome_loja"]
 
         except Exception as e:
             self.logger.error(f"Erro ao obter nome da loja: {e}")
@@ -351,25 +794,22 @@ class GoogleSheetsManager(LoggerMixin):
                 self.logger.error(f"Linha inválida para formatação: {linha}")
                 return False
 
-            # Define o range da linha inteira (colunas A até Z)
-            range_linha = f"A{linha_int}:Z{linha_int}"
-
-            # Formato laranja
-            formato_laranja = {
-                "backgroundColor": {
-                    "red": 1.0,  # 255/255
-                    "green": 0.647,  # 165/255
-                    "blue": 0.0,  # 0/255
-                    # Resultado: #FFA500 (laranja)
-                }
-            }
-
             self.logger.debug(
-                f"Aplicando formatação laranja na linha {linha_int}, range: {range_linha}"
+                "Aplicando formatação laranja na linha %d (colunas A até Z)",
+                linha_int,
             )
 
-            # Aplica a formatação
-            aba.format(range_linha, formato_laranja)
+            # Requisição repeatCell pré-montada: evita o parse de range A1 do
+            # gspread e reutiliza o dicionário de formato do módulo
+            self.planilha.batch_update(
+                {
+                    "requests": [
+                        _requisicao_formato_linha(
+                            aba.id, linha_int, 1, 26, FORMATO_LARANJA
+                        )
+                    ]
+                }
+            )
 
             self.logger.info(
                 f"Formatação laranja aplicada na linha {linha_int} da aba Gerenciador"
@@ -379,11 +819,8 @@ class GoogleSheetsManager(LoggerMixin):
         except APIError as e:
             self.logger.error(f"Erro da API ao aplicar formatação laranja: {e}")
             return False
-        except Exception as e:
-            self.logger.error(f"Erro inesperado ao aplicar formatação laranja: {e}")
-            import traceback
-
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+        except Exception:
+            self.logger.exception("Erro inesperado ao aplicar formatação laranja")
             return False
 
     @log_operacao
@@ -409,50 +846,23 @@ class GoogleSheetsManager(LoggerMixin):
                 self.logger.error(f"Linha inválida para formatação: {linha}")
                 return False
 
-            # Define o range das colunas A até F
-            range_linha = f"A{linha_int}:F{linha_int}"
-
-            # Formatação específica para Lojas Fechadas
-            formatacao_lojas_fechadas = {
-                "backgroundColor": {
-                    "red": 0.863,  # 220/255 = 0.863 (DC)
-                    "green": 0.941,  # 240/255 = 0.941 (F0)
-                    "blue": 0.776,  # 198/255 = 0.776 (C6)
-                    # Resultado: #DCF0C6 (verde claro)
-                },
-                "horizontalAlignment": "CENTER",
-                "verticalAlignment": "MIDDLE",
-                "borders": {
-                    "top": {
-                        "style": "SOLID",
-                        "width": 1,
-                        "color": {"red": 0.0, "green": 0.0, "blue": 0.0},
-                    },
-                    "bottom": {
-                        "style": "SOLID",
-                        "width": 1,
-                        "color": {"red": 0.0, "green": 0.0, "blue": 0.0},
-                    },
-                    "left": {
-                        "style": "SOLID",
-                        "width": 1,
-                        "color": {"red": 0.0, "green": 0.0, "blue": 0.0},
-                    },
-                    "right": {
-                        "style": "SOLID",
-                        "width": 1,
-                        "color": {"red": 0.0, "green": 0.0, "blue": 0.0},
-                    },
-                },
-            }
-
             self.logger.debug(
-                f"Aplicando formatação específica na linha {linha_int}, range: {range_linha}"
+                "Aplicando formatação específica na linha %d (colunas A até F)",
+                linha_int,
             )
-            self.logger.debug(f"Formatação: cor #DCF0C6, centro, bordas")
+            self.logger.debug("Formatação: cor #DCF0C6, centro, bordas")
 
-            # Aplica a formatação
-            aba.format(range_linha, formatacao_lojas_fechadas)
+            # Requisição repeatCell pré-montada: evita o parse de range A1 do
+            # gspread e reutiliza o dicionário de formato do módulo
+            self.planilha.batch_update(
+                {
+                    "requests": [
+                        _requisicao_formato_linha(
+                            aba.id, linha_int, 1, 6, FORMATACAO_LOJAS_FECHADAS
+                        )
+                    ]
+                }
+            )
 
             self.logger.info(
                 f"Formatação específica aplicada na linha {linha_int} da aba Lojas Fechadas"
@@ -462,11 +872,8 @@ class GoogleSheetsManager(LoggerMixin):
         except APIError as e:
             self.logger.warning(f"Erro da API ao aplicar formatação específica: {e}")
             return False  # Não crítico
-        except Exception as e:
-            self.logger.warning(f"Erro ao aplicar formatação específica: {e}")
-            import traceback
-
-            self.logger.debug(f"Traceback formatação: {traceback.format_exc()}")
+        except Exception:
+            self.logger.exception("Erro ao aplicar formatação específica")
             return False  # Não crítico
 
     @log_operacao
@@ -491,22 +898,29 @@ class GoogleSheetsManager(LoggerMixin):
                 self.logger.error(f"Linha inválida: {linha}")
                 return False
 
-            # Atualiza o status para "Fechada" com formato correto da API
-            celula_status = f"{self.config.coluna_status_gerenciador}{linha_int}"
+            coluna_status = self.config.coluna_status_gerenciador_num
 
-            # Usar formato de lista de listas
-            aba.update(celula_status, [[self.config.status_fechada]])
+            # Escrita do status e formatação laranja da linha inteira (A até Z)
+            # fundidas em um único batchUpdate: uma chamada HTTP em vez de duas
+            self._chamada_com_backoff(
+                self.planilha.batch_update,
+                {
+                    "requests": [
+                        _requisicao_valor_celula(
+                            aba.id, linha_int, coluna_status, self.config.status_fechada
+                        ),
+                        _requisicao_formato_linha(
+                            aba.id, linha_int, 1, 26, FORMATO_LARANJA
+                        ),
+                    ]
+                },
+            )
 
             self.logger.info(
-                f"Status atualizado para '{self.config.status_fechada}' na linha {linha_int}"
+                f"Status atualizado para '{self.config.status_fechada}' na linha "
+                f"{linha_int}, com formatação laranja aplicada"
             )
 
-            # Aplica formatação laranja na linha inteira
-            if not self.aplicar_formatacao_laranja_linha(linha_int):
-                self.logger.warning(
-                    f"Erro ao aplicar formatação laranja na linha {linha_int}, mas prosseguindo..."
-                )
-
             return True
 
         except APIError as e:
@@ -524,22 +938,27 @@ class GoogleSheetsManager(LoggerMixin):
             Optional[int]: Número da próxima linha vazia ou None em caso de erro.
         """
         try:
+            # Valor mantido pelas próprias escritas (ou pré-carregado): não
+            # precisa baixar a coluna de novo
+            if self._proxima_linha_fechadas is not None:
+                return self._proxima_linha_fechadas
+
             aba = self.obter_aba(self.config.aba_lojas_fechadas)
             if not aba:
                 return None
 
-            # Converte letra da coluna para número
-            coluna_letra = self.config.coluna_nome_loja_fechadas  # "B"
-            coluna_numero = converter_letra_coluna_para_numero(coluna_letra)  # 2
-
-            # Obtém todos os valores da coluna B (nome da loja)
-            valores_coluna_b = aba.col_values(coluna_numero)
+            # Obtém todos os valores da coluna B (nome da loja), usando o
+            # número de coluna já pré-convertido
+            valores_coluna_b = aba.col_values(
+                self.config.coluna_nome_loja_fechadas_num  # "B" -> 2
+            )
 
             # A próxima linha vazia é o tamanho da lista + 1
             proxima_linha = len(valores_coluna_b) + 1
+            self._proxima_linha_fechadas = proxima_linha
 
             self.logger.debug(
-                f"Próxima linha vazia na aba Lojas Fechadas: {proxima_linha}"
+                "Próxima linha vazia na aba Lojas Fechadas: %d", proxima_linha
             )
             return proxima_linha
 
@@ -571,62 +990,330 @@ class GoogleSheetsManager(LoggerMixin):
             if not aba:
                 return False
 
-            linha = self.encontrar_proxima_linha_vazia_lojas_fechadas()
-            if linha is None:
-                return False
+            # Monta a linha completa respeitando as colunas configuradas
+            valores_por_coluna = [
+                (self.config.coluna_nome_loja_fechadas, nome_loja),
+                (self.config.coluna_numero_loja_fechadas, numero_loja),
+                (self.config.coluna_status_fechadas, self.config.valor_padrao_status_fechadas),
+                (self.config.coluna_data_fechamento, data_fechamento),
+                (self.config.coluna_observacao, observacao),
+            ]
+            indices = [
+                (converter_letra_coluna_para_numero(coluna_letra), valor)
+                for coluna_letra, valor in valores_por_coluna
+            ]
+            linha_valores = [""] * max(indice for indice, _ in indices)
+            for indice, valor in indices:
+                linha_valores[indice - 1] = valor
+
+            # append_row descobre a próxima linha vazia no servidor: dispensa
+            # baixar a coluna inteira só para calcular len(...) + 1
+            resposta = self._chamada_com_backoff(
+                aba.append_row,
+                linha_valores,
+                value_input_option="USER_ENTERED",
+                insert_data_option="INSERT_ROWS",
+                table_range="A1:F1",
+            )
 
-            # Garante que linha seja inteiro
-            linha_int = safe_int(linha, 0)
-            if linha_int <= 0:
-                self.logger.error(f"Linha inválida: {linha}")
+            # A linha usada vem no updatedRange da resposta (ex.: 'Aba'!A7:F7)
+            faixa_atualizada = resposta["updates"]["updatedRange"]
+            correspondencia = re.search(r"![A-Z]+([0-9]+)", faixa_atualizada)
+            if not correspondencia:
+                self.logger.error(
+                    f"Não foi possível determinar a linha inserida: {faixa_atualizada}"
+                )
                 return False
+            linha_int = int(correspondencia.group(1))
+            self._proxima_linha_fechadas = linha_int + 1
 
-            # Prepara os dados para inserir usando batch_update (formato correto)
-            updates = [
-                {
-                    "range": f"{self.config.coluna_nome_loja_fechadas}{linha_int}",
-                    "values": [[nome_loja]],
-                },
-                {
-                    "range": f"{self.config.coluna_numero_loja_fechadas}{linha_int}",
-                    "values": [[numero_loja]],
-                },
+            # Formatação das colunas A até F da linha recém-preenchida
+            self._chamada_com_backoff(
+                self.planilha.batch_update,
                 {
-                    "range": f"{self.config.coluna_status_fechadas}{linha_int}",
-                    "values": [[self.config.valor_padrao_status_fechadas]],
-                },
-                {
-                    "range": f"{self.config.coluna_data_fechamento}{linha_int}",
-                    "values": [[data_fechamento]],
+                    "requests": [
+                        _requisicao_formato_linha(
+                            aba.id, linha_int, 1, 6, FORMATACAO_LOJAS_FECHADAS
+                        )
+                    ]
                 },
+            )
+
+            self.logger.info(
+                f"Loja {numero_loja} adicionada à aba Lojas Fechadas na linha {linha_int}"
+            )
+            return True
+
+        except APIError as e:
+            self.logger.error(f"Erro da API ao adicionar loja fechada: {e}")
+            return False
+        except Exception:
+            self.logger.exception("Erro inesperado ao adicionar loja fechada")
+            return False
+
+    def obter_indice_lojas_gerenciador(
+        self, forcar_recarga: bool = False
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Monta um índice número da loja -> dados da linha a partir de uma única
+        leitura da aba Gerenciador. O índice é reutilizado durante a sessão.
+
+        Args:
+            forcar_recarga (bool): Ignora o índice em cache e relê a aba.
+
+        Returns:
+            Optional[Dict]: Dicionário {numero_normalizado: {"linha": int,
+                "nome_loja": str, "grupo": str, "status_d": str,
+                "status_i": str}} ou None em caso de erro.
+        """
+        if self._indice_gerenciador is not None and not forcar_recarga:
+            return self._indice_gerenciador
+
+        try:
+            aba = self.obter_aba(self.config.aba_gerenciador)
+            if not aba:
+                return None
+
+            coluna_numeros = self.config.coluna_numero_loja_gerenciador_num
+
+            # Uma leitura única das colunas A até I cobre número (C), grupo (B),
+            # nome (G) e os dois status (D e I)
+            valores = aba.get_values(
+                "A1:I",
+                value_render_option="UNFORMATTED_VALUE",
+            )
+
+            linha_inicio = safe_int(self.config.linha_inicio_gerenciador, 6)
+
+            def celula(linha_valores, coluna, padrao=""):
+                if len(linha_valores) >= coluna and linha_valores[coluna - 1]:
+                    return limpar_texto(linha_valores[coluna - 1])
+                return padrao
+
+            indice = {}
+            for indice_lista, linha_valores in enumerate(valores):
+                linha_planilha = indice_lista + 1
+                if linha_planilha < linha_inicio:
+                    continue
+
+                valor_celula = (
+                    linha_valores[coluna_numeros - 1]
+                    if len(linha_valores) >= coluna_numeros
+                    else ""
+                )
+                numero_normalizado = normalizar_tipo_numero_loja(valor_celula)
+                if not numero_normalizado or numero_normalizado in indice:
+                    continue
+
+                indice[numero_normalizado] = {
+                    "linha": linha_planilha,
+                    "nome_loja": celula(linha_valores, 7, "Nome não encontrado"),
+                    "grupo": celula(linha_valores, 2, "Não informado"),
+                    "status_d": celula(linha_valores, 4, "Não informado"),
+                    "status_i": celula(linha_valores, 9, "Não informado"),
+                }
+
+            self.logger.debug("Índice da aba Gerenciador com %d lojas", len(indice))
+            self._indice_gerenciador = indice
+            return indice
+
+        except APIError as e:
+            self.logger.error(f"Erro da API ao montar índice de lojas: {e}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Erro inesperado ao montar índice de lojas: {e}")
+            return None
+
+    def obter_entrada_indice_gerenciador(
+        self, numero_loja: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Busca uma loja no índice da aba Gerenciador, com comparação flexível
+        para códigos alfanuméricos (I5 == I05).
+
+        Args:
+            numero_loja (str): Número da loja.
+
+        Returns:
+            Optional[Dict]: Entrada do índice ou None se não encontrada.
+        """
+        indice = self.obter_indice_lojas_gerenciador()
+        if indice is None:
+            return None
+
+        numero_normalizado = normalizar_tipo_numero_loja(numero_loja)
+
+        entrada = indice.get(numero_normalizado)
+        if entrada is not None:
+            return entrada
+
+        # Para códigos alfanuméricos, tenta correspondência flexível
+        if validar_codigo_alfanumerico(numero_normalizado):
+            for chave, valor in indice.items():
+                if validar_codigo_alfanumerico(chave) and comparar_codigos_flexivel(
+                    chave, numero_normalizado
+                ):
+                    return valor
+
+        return None
+
+    def invalidar_indice_loja(self, numero_loja: str):
+        """Remove uma loja do índice em cache (após alteração de status)."""
+        numero_normalizado = normalizar_tipo_numero_loja(numero_loja)
+        if self._indice_gerenciador is not None:
+            self._indice_gerenciador.pop(numero_normalizado, None)
+        self._cache_linha.pop(numero_normalizado, None)
+
+    def invalidar_indice_gerenciador(self):
+        """Descarta os índices em cache, forçando releitura na próxima busca."""
+        self._indice_gerenciador = None
+        self._indice_coluna_gerenciador = None
+        self._coluna_bruta_gerenciador = None
+        self._cache_linha.clear()
+
+    @log_operacao
+    def atualizar_status_lojas_gerenciador_em_lote(self, linhas: list) -> bool:
+        """
+        Atualiza o status de várias lojas na aba Gerenciador em uma única
+        chamada batch_update, mais uma chamada de formatação para as linhas.
+
+        Args:
+            linhas (list): Linhas das lojas na aba Gerenciador.
+
+        Returns:
+            bool: True se atualizado com sucesso, False caso contrário.
+        """
+        try:
+            if not linhas:
+                return True
+
+            aba = self.obter_aba(self.config.aba_gerenciador)
+            if not aba:
+                return False
+
+            coluna_status = self.config.coluna_status_gerenciador
+            status_fechada = self.config.status_fechada
+
+            updates = [
                 {
-                    "range": f"{self.config.coluna_observacao}{linha_int}",
-                    "values": [[observacao]],
-                },
+                    "range": f"{coluna_status}{linha}",
+                    "values": [[status_fechada]],
+                }
+                for linha in linhas
             ]
+            self._chamada_com_backoff(aba.batch_update, updates)
 
-            # Executa batch_update
-            aba.batch_update(updates)
+            self.logger.info(
+                f"Status atualizado para '{status_fechada}' em {len(linhas)} linhas"
+            )
+
+            # Formatação laranja de todas as linhas em uma única chamada
+            try:
+                formatos = [
+                    {"range": f"A{linha}:Z{linha}", "format": FORMATO_LARANJA}
+                    for linha in linhas
+                ]
+                aba.batch_format(formatos)
+            except APIError as e:
+                self.logger.warning(
+                    f"Erro ao aplicar formatação laranja em lote, mas prosseguindo: {e}"
+                )
+
+            return True
+
+        except APIError as e:
+            self.logger.error(f"Erro da API ao atualizar status em lote: {e}")
+            return False
+        except Exception as e:
+            self.logger.error(f"Erro inesperado ao atualizar status em lote: {e}")
+            return False
+
+    @log_operacao
+    def adicionar_lojas_fechadas_em_lote(self, registros: list) -> bool:
+        """
+        Adiciona várias lojas na aba Lojas Fechadas com uma única chamada de
+        escrita e uma de formatação.
+
+        Args:
+            registros (list): Lista de registros com os atributos nome_loja,
+                numero_loja, data_fechamento e observacao.
+
+        Returns:
+            bool: True se adicionado com sucesso, False caso contrário.
+        """
+        try:
+            if not registros:
+                return True
+
+            aba = self.obter_aba(self.config.aba_lojas_fechadas)
+            if not aba:
+                return False
+
+            primeira_linha = self.encontrar_proxima_linha_vazia_lojas_fechadas()
+            if primeira_linha is None:
+                return False
+
+            updates = []
+            for deslocamento, registro in enumerate(registros):
+                linha = primeira_linha + deslocamento
+                updates.extend(
+                    [
+                        {
+                            "range": f"{self.config.coluna_nome_loja_fechadas}{linha}",
+                            "values": [[registro.nome_loja]],
+                        },
+                        {
+                            "range": f"{self.config.coluna_numero_loja_fechadas}{linha}",
+                            "values": [[registro.numero_loja]],
+                        },
+                        {
+                            "range": f"{self.config.coluna_status_fechadas}{linha}",
+                            "values": [[self.config.valor_padrao_status_fechadas]],
+                        },
+                        {
+                            "range": f"{self.config.coluna_data_fechamento}{linha}",
+                            "values": [[registro.data_fechamento]],
+                        },
+                        {
+                            "range": f"{self.config.coluna_observacao}{linha}",
+                            "values": [[registro.observacao]],
+                        },
+                    ]
+                )
+
+            self._chamada_com_backoff(aba.batch_update, updates)
 
-            # Aplica formatação específica (cor #DCF0C6, centro, bordas)
-            if not self.aplicar_formatacao_lojas_fechadas(linha_int):
+            ultima_linha = primeira_linha + len(registros) - 1
+            self._proxima_linha_fechadas = ultima_linha + 1
+
+            # Formatação das linhas recém-inseridas em uma única chamada
+            try:
+                aba.batch_format(
+                    [
+                        {
+                            "range": f"A{primeira_linha}:F{ultima_linha}",
+                            "format": FORMATACAO_LOJAS_FECHADAS,
+                        }
+                    ]
+                )
+            except APIError as e:
                 self.logger.warning(
-                    f"Erro ao aplicar formatação na linha {linha_int}, mas dados foram inseridos"
+                    f"Erro ao aplicar formatação em lote, mas dados foram inseridos: {e}"
                 )
 
             self.logger.info(
-                f"Loja {numero_loja} adicionada à aba Lojas Fechadas na linha {linha_int}"
+                f"{len(registros)} lojas adicionadas à aba Lojas Fechadas "
+                f"(linhas {primeira_linha} a {ultima_linha})"
             )
             return True
 
         except APIError as e:
-            self.logger.error(f"Erro da API ao adicionar loja fechada: {e}")
+            self.logger.error(f"Erro da API ao adicionar lojas fechadas em lote: {e}")
             return False
         except Exception as e:
-            self.logger.error(f"Erro inesperado ao adicionar loja fechada: {e}")
-            import traceback
-
-            self.logger.error(f"Traceback completo: {traceback.format_exc()}")
+            self.logger.error(
+                f"Erro inesperado ao adicionar lojas fechadas em lote: {e}"
+            )
             return False
 
     def testar_conexao(self) -> bool:
@@ -640,9 +1327,17 @@ class GoogleSheetsManager(LoggerMixin):
             if not self.conectado:
                 return False
 
-            # Tenta obter as abas principais
-            aba_gerenciador = self.obter_aba(self.config.aba_gerenciador)
-            aba_lojas_fechadas = self.obter_aba(self.config.aba_lojas_fechadas)
+            # Tenta obter as abas principais; as duas resoluções são chamadas
+            # HTTP independentes e rodam em paralelo (gargalo é a rede)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futuro_gerenciador = executor.submit(
+                    self.obter_aba, self.config.aba_gerenciador
+                )
+                futuro_lojas_fechadas = executor.submit(
+                    self.obter_aba, self.config.aba_lojas_fechadas
+                )
+                aba_gerenciador = futuro_gerenciador.result()
+                aba_lojas_fechadas = futuro_lojas_fechadas.result()
 
             if aba_gerenciador is None or aba_lojas_fechadas is None:
                 return False
@@ -659,4 +1354,10 @@ class GoogleSheetsManager(LoggerMixin):
         self.cliente = None
         self.planilha = None
         self.conectado = False
+        self._indice_gerenciador = None
+        self._indice_coluna_gerenciador = None
+        self._coluna_bruta_gerenciador = None
+        self._cache_linha.clear()
+        self._proxima_linha_fechadas = None
+        self._abas.clear()
         self.logger.info("Desconectado do Google Sheets")
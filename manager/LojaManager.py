@@ -3,8 +3,9 @@ Módulo para gerenciar operações de fechamento de lojas.
 ATUALIZADO: Removida operação de limpeza das colunas A e B
 """
 
-from typing import Optional, Dict, Any
+from typing import NamedTuple, Optional, Dict, Any
 from dataclasses import dataclass
+from functools import lru_cache
 
 from manager.GoogleSheetsManager import GoogleSheetsManager
 from logger.Logger import LoggerMixin, log_operacao
@@ -15,13 +16,41 @@ from utils.Utils import (
 )
 
 
-@dataclass
+class DetalhesFechamento(NamedTuple):
+    """Detalhes de um fechamento bem-sucedido (tupla: uma única alocação)."""
+
+    numero_loja: str
+    nome_loja: str
+    linha_gerenciador: int
+    data_fechamento: str
+    observacao: str
+
+
+@dataclass(slots=True, frozen=True)
 class ResultadoFechamento:
     """Classe para representar o resultado de um fechamento de loja."""
 
     sucesso: bool
     mensagem: str
-    detalhes: Optional[Dict[str, Any]] = None
+    detalhes: Optional[DetalhesFechamento] = None
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def falha(cls, mensagem: str) -> "ResultadoFechamento":
+        """
+        Resultado de falha memoizado por mensagem.
+
+        Como a instância é imutável (frozen) e sem detalhes, mensagens
+        repetidas em um lote compartilham o mesmo objeto em vez de alocar
+        um novo a cada loja.
+
+        Args:
+            mensagem (str): Mensagem de falha.
+
+        Returns:
+            ResultadoFechamento: Instância compartilhada de falha.
+        """
+        return cls(sucesso=False, mensagem=mensagem)
 
 
 class LojaManager(LoggerMixin):
@@ -40,6 +69,18 @@ class LojaManager(LoggerMixin):
         """
         return self.sheets_manager.conectar()
 
+    def assegurar_conexao(self) -> bool:
+        """
+        Garante que há conexão ativa com o Google Sheets, conectando apenas
+        se necessário (reaproveita a sessão entre operações).
+
+        Returns:
+            bool: True se conectado, False caso contrário.
+        """
+        if self.sheets_manager.conectado:
+            return True
+        return self.sheets_manager.conectar()
+
     def desconectar(self):
         """Desconecta do Google Sheets."""
         self.sheets_manager.desconectar()
@@ -57,25 +98,64 @@ class LojaManager(LoggerMixin):
         """
         try:
             if not validar_numero_loja(numero_loja):
-                self.logger.warning(f"Número de loja inválido: {numero_loja}")
+                self.logger.warning("Número de loja inválido: %s", numero_loja)
                 return None
 
-            # Usa a nova função que obtém informações completas
-            info = self.sheets_manager.obter_informacoes_completas_loja(numero_loja)
+            # Consulta o índice da sessão em vez de varrer a planilha
+            entrada = self.sheets_manager.obter_entrada_indice_gerenciador(numero_loja)
+
+            info = None
+            if entrada:
+                info = {
+                    "numero_loja": numero_loja,
+                    "linha_gerenciador": entrada["linha"],
+                    "grupo": entrada["grupo"],
+                    "nome_loja": entrada["nome_loja"],
+                    "status_d": entrada["status_d"],
+                    "status_i": entrada["status_i"],
+                }
 
             if info:
                 self.logger.debug(
-                    f"Informações obtidas para loja {numero_loja}: {info}"
+                    "Informações obtidas para loja %s: %s", numero_loja, info
                 )
             else:
-                self.logger.debug(f"Loja {numero_loja} não encontrada")
+                self.logger.debug("Loja %s não encontrada", numero_loja)
 
             return info
 
         except Exception as e:
-            self.logger.error(f"Erro ao obter informações da loja {numero_loja}: {e}")
+            self.logger.error(
+                "Erro ao obter informações da loja %s: %s", numero_loja, e
+            )
             return None
 
+    def obter_informacoes_lojas_batch(
+        self, numeros_lojas: list
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Obtém informações de várias lojas com uma única leitura da planilha.
+
+        O índice da aba Gerenciador é montado na primeira consulta e
+        reutilizado para todas as demais, em vez de uma chamada por loja.
+
+        Args:
+            numeros_lojas (list): Lista de números de lojas.
+
+        Returns:
+            Dict[str, Optional[Dict]]: Informações indexadas por número da
+                loja (None para lojas não encontradas).
+        """
+        resultados = {}
+
+        for numero_loja in numeros_lojas:
+            numero = numero_loja.strip() if numero_loja else ""
+            if not numero:
+                continue
+            resultados[numero] = self.obter_informacoes_loja(numero)
+
+        return resultados
+
     @log_operacao
     def fechar_loja(
         self, numero_loja: str, observacao: Optional[str] = None
@@ -93,32 +173,29 @@ class LojaManager(LoggerMixin):
         try:
             # Validação inicial
             if not validar_numero_loja(numero_loja):
-                return ResultadoFechamento(
-                    sucesso=False, mensagem=f"Número de loja inválido: {numero_loja}"
+                return ResultadoFechamento.falha(
+                    f"Número de loja inválido: {numero_loja}"
                 )
 
-            # Busca a loja na aba Gerenciador
-            linha = self.sheets_manager.buscar_numero_loja_na_aba_gerenciador(
-                numero_loja
-            )
-            if linha is None:
-                return ResultadoFechamento(
-                    sucesso=False,
-                    mensagem=f"Loja {numero_loja} não encontrada na aba Gerenciador",
+            # Busca a loja no índice da aba Gerenciador (uma leitura por sessão)
+            entrada = self.sheets_manager.obter_entrada_indice_gerenciador(numero_loja)
+            if entrada is None:
+                return ResultadoFechamento.falha(
+                    f"Loja {numero_loja} não encontrada na aba Gerenciador"
                 )
 
-            # Obtém o nome da loja
-            nome_loja = self.sheets_manager.obter_nome_loja_por_numero(numero_loja)
-            if not nome_loja:
-                nome_loja = f"Loja {numero_loja}"
+            linha = entrada["linha"]
+            nome_loja = entrada["nome_loja"] or f"Loja {numero_loja}"
 
             # Atualiza status na aba Gerenciador (inclui formatação laranja)
             if not self.sheets_manager.atualizar_status_loja_gerenciador(linha):
-                return ResultadoFechamento(
-                    sucesso=False,
-                    mensagem=f"Erro ao atualizar status da loja {numero_loja}",
+                return ResultadoFechamento.falha(
+                    f"Erro ao atualizar status da loja {numero_loja}"
                 )
 
+            # O status da loja mudou: descarta apenas a entrada correspondente
+            self.sheets_manager.invalidar_indice_loja(numero_loja)
+
             # REMOVIDO: Limpeza das colunas A e B
             # A linha anterior `limpar_colunas_gerenciador` foi removida
 
@@ -132,28 +209,28 @@ class LojaManager(LoggerMixin):
             if not self.sheets_manager.adicionar_loja_fechada(
                 nome_loja, numero_loja, data_fechamento, observacao_final
             ):
-                return ResultadoFechamento(
-                    sucesso=False,
-                    mensagem=f"Erro ao adicionar loja {numero_loja} na aba Lojas Fechadas",
+                return ResultadoFechamento.falha(
+                    f"Erro ao adicionar loja {numero_loja} na aba Lojas Fechadas"
                 )
 
             return ResultadoFechamento(
                 sucesso=True,
                 mensagem=f"Loja {numero_loja} ({nome_loja}) fechada com sucesso!",
-                detalhes={
-                    "numero_loja": numero_loja,
-                    "nome_loja": nome_loja,
-                    "linha_gerenciador": linha,
-                    "data_fechamento": data_fechamento,
-                    "observacao": observacao_final,
-                },
+                detalhes=DetalhesFechamento(
+                    numero_loja=numero_loja,
+                    nome_loja=nome_loja,
+                    linha_gerenciador=linha,
+                    data_fechamento=data_fechamento,
+                    observacao=observacao_final,
+                ),
             )
 
         except Exception as e:
-            self.logger.error(f"Erro inesperado ao fechar loja {numero_loja}: {e}")
-            return ResultadoFechamento(
-                sucesso=False,
-                mensagem=f"Erro inesperado ao fechar loja {numero_loja}: {e}",
+            self.logger.error(
+                "Erro inesperado ao fechar loja %s: %s", numero_loja, e
+            )
+            return ResultadoFechamento.falha(
+                f"Erro inesperado ao fechar loja {numero_loja}: {e}"
             )
 
     def fechar_multiplas_lojas(
@@ -171,13 +248,136 @@ class LojaManager(LoggerMixin):
         """
         resultados = {}
 
+        # Deduplica preservando a ordem: repetições na lista não pagam as
+        # chamadas de rede uma segunda vez
+        numeros_unicos = {}
         for numero_loja in numeros_lojas:
-            if not numero_loja or not numero_loja.strip():
+            numero_limpo = numero_loja.strip() if numero_loja else ""
+            if numero_limpo:
+                numeros_unicos.setdefault(numero_limpo.upper(), None)
+
+        for numero_limpo in numeros_unicos:
+            # Códigos inválidos não chegam a tocar a rede
+            if not validar_numero_loja(numero_limpo):
+                resultados[numero_limpo] = ResultadoFechamento.falha(
+                    f"Número de loja inválido: {numero_limpo}"
+                )
                 continue
 
-            numero_limpo = numero_loja.strip()
-            resultado = self.fechar_loja(numero_limpo, observacao)
-            resultados[numero_limpo] = resultado
+            resultados[numero_limpo] = self.fechar_loja(numero_limpo, observacao)
+
+        return resultados
+
+    @log_operacao
+    def fechar_multiplas_lojas_batch(
+        self, numeros_lojas: list, observacao: Optional[str] = None
+    ) -> Dict[str, ResultadoFechamento]:
+        """
+        Fecha múltiplas lojas agrupando as escritas no Google Sheets.
+
+        Em vez de três chamadas à API por loja, faz uma leitura única da aba
+        Gerenciador para montar o índice e depois uma escrita em lote por aba.
+
+        Args:
+            numeros_lojas (list): Lista de números de lojas para fechar.
+            observacao (Optional[str]): Observação personalizada.
+
+        Returns:
+            Dict[str, ResultadoFechamento]: Resultados indexados por número da loja.
+        """
+        resultados = {}
+
+        # Deduplica preservando a ordem antes de qualquer chamada de rede
+        numeros_unicos = {}
+        for numero in numeros_lojas:
+            numero_limpo = numero.strip() if numero else ""
+            if numero_limpo:
+                numeros_unicos.setdefault(numero_limpo.upper(), None)
+
+        numeros_limpos = list(numeros_unicos)
+        if not numeros_limpos:
+            return resultados
+
+        # Uma única leitura da aba Gerenciador para todas as lojas
+        indice = self.sheets_manager.obter_indice_lojas_gerenciador()
+        if indice is None:
+            for numero_loja in numeros_limpos:
+                resultados[numero_loja] = ResultadoFechamento.falha(
+                    "Erro ao ler a aba Gerenciador"
+                )
+            return resultados
+
+        data_fechamento = obter_data_atual()
+
+        # Separa lojas encontradas das inválidas/não encontradas
+        lojas_para_fechar = []
+        for numero_loja in numeros_limpos:
+            if not validar_numero_loja(numero_loja):
+                resultados[numero_loja] = ResultadoFechamento.falha(
+                    f"Número de loja inválido: {numero_loja}"
+                )
+                continue
+
+            # Mesma resolução do caminho unitário, com fallback flexível para
+            # códigos alfanuméricos (I005 encontra I05); o índice já está em
+            # cache, então não há leitura extra por loja
+            entrada = self.sheets_manager.obter_entrada_indice_gerenciador(
+                numero_loja
+            )
+            if entrada is None:
+                resultados[numero_loja] = ResultadoFechamento.falha(
+                    f"Loja {numero_loja} não encontrada na aba Gerenciador"
+                )
+                continue
+
+            lojas_para_fechar.append(
+                DetalhesFechamento(
+                    numero_loja=numero_loja,
+                    nome_loja=entrada["nome_loja"] or f"Loja {numero_loja}",
+                    linha_gerenciador=entrada["linha"],
+                    data_fechamento=data_fechamento,
+                    observacao=(
+                        observacao
+                        if observacao
+                        else criar_observacao_padrao(numero_loja)
+                    ),
+                )
+            )
+
+        if not lojas_para_fechar:
+            return resultados
+
+        # Uma escrita em lote por aba, independente do número de lojas
+        linhas = [loja.linha_gerenciador for loja in lojas_para_fechar]
+        status_ok = self.sheets_manager.atualizar_status_lojas_gerenciador_em_lote(
+            linhas
+        )
+        if status_ok:
+            for loja in lojas_para_fechar:
+                self.sheets_manager.invalidar_indice_loja(loja.numero_loja)
+
+        fechadas_ok = status_ok and self.sheets_manager.adicionar_lojas_fechadas_em_lote(
+            lojas_para_fechar
+        )
+
+        for loja in lojas_para_fechar:
+            numero_loja = loja.numero_loja
+            if fechadas_ok:
+                resultados[numero_loja] = ResultadoFechamento(
+                    sucesso=True,
+                    mensagem=(
+                        f"Loja {numero_loja} ({loja.nome_loja}) fechada com sucesso!"
+                    ),
+                    detalhes=loja,
+                )
+            elif not status_ok:
+                resultados[numero_loja] = ResultadoFechamento.falha(
+                    f"Erro ao atualizar status da loja {numero_loja}"
+                )
+            else:
+                resultados[numero_loja] = ResultadoFechamento.falha(
+                    f"Erro ao adicionar loja {numero_loja} na aba Lojas Fechadas"
+                )
 
         return resultados
 
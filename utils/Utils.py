@@ -3,11 +3,89 @@ Módulo de utilitários para o sistema de fechamento de lojas.
 CORREÇÃO DEFINITIVA: Inclui função converter_letra_coluna_para_numero melhorada
 """
 
+import logging
+import math
 import re
+import sys
+import time
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
 from logger.Logger import obter_logger
 
+# Logger do módulo resolvido uma vez no import: os caminhos quentes não
+# pagam nem o lookup memoizado por chamada
+_LOGGER = obter_logger("utils")
+
+# Padrões pré-compilados no import: evita o lookup no cache interno do
+# módulo re a cada chamada nas funções quentes de validação/normalização
+_PADRAO_NAO_ALFANUM = re.compile(r"[^A-Za-z0-9]")
+_PADRAO_INTEIROS = re.compile(r"-?\d+")
+_PADRAO_SEPARADORES = re.compile(r"[\s,]+")
+
+# Tabela de translate que descarta tudo que não é ASCII alfanumérico: uma
+# passada em C no lugar do regex para entradas ASCII (o caso normal)
+_TABELA_SO_ALFANUM = {
+    i: None for i in range(256) if not chr(i).isascii() or not chr(i).isalnum()
+}
+
+
+def _separar_letras_digitos(codigo_str: str):
+    """
+    Separa um código como 'AB12' em ('AB', '12') com uma única varredura.
+
+    Substitui o regex ^([A-Z]+)([0-9]+)$ compartilhado pela validação,
+    normalização e comparação flexível: um scan direto sem motor de regex.
+
+    Args:
+        codigo_str (str): Código já em maiúsculas e sem espaços.
+
+    Returns:
+        Optional[tuple]: (letras, digitos) ou None se não segue o padrão.
+    """
+    tamanho = len(codigo_str)
+
+    fim_letras = 0
+    while fim_letras < tamanho and "A" <= codigo_str[fim_letras] <= "Z":
+        fim_letras += 1
+    if fim_letras == 0 or fim_letras == tamanho:
+        return None
+
+    fim_digitos = fim_letras
+    while fim_digitos < tamanho and "0" <= codigo_str[fim_digitos] <= "9":
+        fim_digitos += 1
+    if fim_digitos != tamanho:
+        return None
+
+    return codigo_str[:fim_letras], codigo_str[fim_letras:]
+
+
+def _validar_numero_loja_str(numero_str: str) -> bool:
+    """Valida a string já limpa: ASCII alfanumérico, sem motor de regex."""
+    # Equivalente a ^[A-Za-z0-9]+$ com dois predicados em C
+    return numero_str.isascii() and numero_str.isalnum()
+
+
+def _somente_alfanum(texto_str: str) -> str:
+    """
+    Remove da string já limpa tudo que não é ASCII alfanumérico.
+
+    Recebe a string canônica direto para os chamadores internos não
+    repetirem o str()/strip() da entrada pública.
+
+    Args:
+        texto_str (str): String já sem espaços nas pontas.
+
+    Returns:
+        str: Apenas os caracteres alfanuméricos.
+    """
+    # translate em uma passada C para ASCII; regex só no caso raro de
+    # haver caracteres fora da tabela
+    if texto_str.isascii():
+        return texto_str.translate(_TABELA_SO_ALFANUM)
+    return _PADRAO_NAO_ALFANUM.sub("", texto_str)
+
 
 def validar_numero_loja(numero_loja: Any) -> bool:
     """
@@ -22,8 +100,15 @@ def validar_numero_loja(numero_loja: Any) -> bool:
     if numero_loja is None:
         return False
 
-    # Converte para string para validação
-    numero_str = str(numero_loja).strip()
+    # Caminho rápido para inteiros (células numéricas da planilha): um
+    # inteiro não negativo sempre vira string alfanumérica, sem regex
+    if isinstance(numero_loja, int):
+        return numero_loja >= 0
+
+    # Evita o str() redundante quando a entrada já é string
+    if not isinstance(numero_loja, str):
+        numero_loja = str(numero_loja)
+    numero_str = numero_loja.strip()
 
     # Verifica se não está vazio
     if not numero_str:
@@ -31,7 +116,7 @@ def validar_numero_loja(numero_loja: Any) -> bool:
 
     # Verifica se é um número válido (pode conter letras e números)
     # Suporta formatos como: 123, I05, T09, ABC123, etc.
-    return bool(re.match(r"^[A-Za-z0-9]+$", numero_str))
+    return _validar_numero_loja_str(numero_str)
 
 
 def validar_codigo_alfanumerico(codigo: Any) -> bool:
@@ -55,9 +140,8 @@ def validar_codigo_alfanumerico(codigo: Any) -> bool:
 
     # Padrão para códigos alfanuméricos: 1-3 letras seguidas de 1-4 números
     # Exemplos: I05, T09, I01, AB123, XYZ9999
-    patron_alfanumerico = r"^[A-Z]{1,3}[0-9]{1,4}$"
-
-    return bool(re.match(patron_alfanumerico, codigo_str))
+    partes = _separar_letras_digitos(codigo_str)
+    return partes is not None and len(partes[0]) <= 3 and len(partes[1]) <= 4
 
 
 def normalizar_codigo_alfanumerico(codigo: Any) -> str:
@@ -81,53 +165,85 @@ def normalizar_codigo_alfanumerico(codigo: Any) -> str:
             return ""
 
         # Separa letras e números
-        match = re.match(r"^([A-Z]+)([0-9]+)$", codigo_str)
+        partes = _separar_letras_digitos(codigo_str)
 
-        if match:
-            letras, numeros = match.groups()
+        if partes:
+            letras, numeros = partes
 
             # Para códigos com 1 letra, adiciona padding de zeros até 2 dígitos
             if len(letras) == 1 and len(numeros) <= 2:
                 numeros_padded = numeros.zfill(2)
                 resultado = f"{letras}{numeros_padded}"
 
-                logger = obter_logger("utils")
-                logger.debug(
-                    f"Código alfanumérico normalizado: '{codigo}' -> '{resultado}'"
-                )
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Código alfanumérico normalizado: '%s' -> '%s'",
+                        codigo,
+                        resultado,
+                    )
 
                 return resultado
             else:
                 # Para outros casos, mantém como está
                 return codigo_str
 
-        # Se não corresponde ao padrão alfanumérico, retorna formatado normalmente
-        return formatar_numero_loja(codigo_str)
+        # Se não corresponde ao padrão alfanumérico, retorna formatado
+        # normalmente (codigo_str já está canônica: sem novo strip/upper)
+        return _somente_alfanum(codigo_str)
 
     except Exception as e:
-        logger = obter_logger("utils")
-        logger.warning(f"Erro ao normalizar código alfanumérico '{codigo}': {e}")
+        _LOGGER.warning("Erro ao normalizar código alfanumérico '%s': %s", codigo, e)
         return formatar_numero_loja(codigo) if codigo else ""
 
 
+# Datas formatadas memoizadas por uma janela curta: em lotes grandes cada
+# loja chamava datetime.now() + strftime para produzir a mesma string
+_cache_data_atual = (0.0, "")
+_cache_data_hora_atual = (0.0, "")
+
+
 def obter_data_atual() -> str:
     """
     Obtém a data atual no formato brasileiro.
 
+    O valor tem resolução de dia, então reutiliza a string formatada por
+    uma janela de 0,5s (cobre um lote inteiro de fechamentos).
+
     Returns:
         str: Data atual no formato DD/MM/AAAA.
     """
-    return datetime.now().strftime("%d/%m/%Y")
+    global _cache_data_atual
+
+    momento, valor = _cache_data_atual
+    agora = time.monotonic()
+    if valor and agora - momento < 0.5:
+        return valor
+
+    valor = datetime.now().strftime("%d/%m/%Y")
+    _cache_data_atual = (agora, valor)
+    return valor
 
 
 def obter_data_hora_atual() -> str:
     """
     Obtém a data e hora atual no formato brasileiro.
 
+    Como o formato tem resolução de segundo, reutiliza a string formatada
+    por uma janela de 0,1s.
+
     Returns:
         str: Data e hora atual no formato DD/MM/AAAA HH:MM:SS.
     """
-    return datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+    global _cache_data_hora_atual
+
+    momento, valor = _cache_data_hora_atual
+    agora = time.monotonic()
+    if valor and agora - momento < 0.1:
+        return valor
+
+    valor = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+    _cache_data_hora_atual = (agora, valor)
+    return valor
 
 
 def formatar_numero_loja(numero_loja: Any) -> str:
@@ -143,13 +259,8 @@ def formatar_numero_loja(numero_loja: Any) -> str:
     if numero_loja is None:
         return ""
 
-    # Converte para string e remove espaços
-    numero_str = str(numero_loja).strip()
-
-    # Remove caracteres especiais, mantendo apenas letras e números
-    numero_limpo = re.sub(r"[^A-Za-z0-9]", "", numero_str)
-
-    return numero_limpo.upper()
+    # Converte para string, remove espaços e mantém só letras e números
+    return _somente_alfanum(str(numero_loja).strip()).upper()
 
 
 def validar_nome_loja(nome_loja: Any) -> bool:
@@ -169,10 +280,14 @@ def validar_nome_loja(nome_loja: Any) -> bool:
     return len(nome_str) > 0
 
 
+@lru_cache(maxsize=128)
 def converter_numero_coluna_para_letra(numero: int) -> str:
     """
     Converte número da coluna para letra (1=A, 2=B, etc.).
 
+    Memoizada e montada com join: evita o prepend de string por dígito
+    (que realoca o resultado a cada volta) e conversões repetidas.
+
     Args:
         numero (int): Número da coluna.
 
@@ -182,19 +297,23 @@ def converter_numero_coluna_para_letra(numero: int) -> str:
     if numero <= 0:
         raise ValueError("Número da coluna deve ser maior que zero")
 
-    resultado = ""
+    letras = []
     while numero > 0:
         numero -= 1
-        resultado = chr(numero % 26 + ord("A")) + resultado
+        letras.append(chr(numero % 26 + ord("A")))
         numero //= 26
-    return resultado
+    return "".join(reversed(letras))
 
 
+@lru_cache(maxsize=128)
 def converter_letra_coluna_para_numero(letra: str) -> int:
     """
     CORREÇÃO CRÍTICA: Converte letra da coluna para número (A=1, B=2, etc.).
     Esta função é essencial para resolver o erro do gspread.
 
+    Memoizada: função pura de um conjunto pequeno de letras de coluna, então
+    conversões repetidas viram um acesso de dicionário.
+
     Args:
         letra (str): Letra da coluna.
 
@@ -218,14 +337,12 @@ def converter_letra_coluna_para_numero(letra: str) -> int:
             numero = numero * 26 + (ord(char) - ord("A") + 1)
 
         # Log para debug
-        logger = obter_logger("utils")
-        logger.debug(f"Conversão coluna: '{letra}' -> {numero}")
+        _LOGGER.debug("Conversão coluna: '%s' -> %d", letra, numero)
 
         return numero
 
     except Exception as e:
-        logger = obter_logger("utils")
-        logger.error(f"Erro ao converter letra da coluna '{letra}': {e}")
+        _LOGGER.error("Erro ao converter letra da coluna '%s': %s", letra, e)
         # Em caso de erro, retorna valor padrão baseado na primeira letra
         if letra and len(letra) > 0:
             return ord(letra[0].upper()) - ord("A") + 1
@@ -245,13 +362,9 @@ def limpar_texto(texto: Any) -> str:
     if texto is None:
         return ""
 
-    # Converte para string e remove espaços em excesso
-    texto_str = str(texto).strip()
-
-    # Remove múltiplos espaços internos
-    texto_limpo = re.sub(r"\s+", " ", texto_str)
-
-    return texto_limpo
+    # Converte para string; split/join colapsa qualquer sequência de
+    # espaços (e remove os das pontas) em uma única passada em C
+    return " ".join(str(texto).split())
 
 
 def criar_observacao_padrao(numero_loja: str) -> str:
@@ -283,15 +396,21 @@ def safe_int(valor: Any, padrao: int = 0) -> int:
         return padrao
 
     try:
+        # Booleanos antes de int (bool é subclasse): True/False viram 1/0
+        # explícitos em vez de vazar o objeto bool como "int"
+        if valor is True:
+            return 1
+        if valor is False:
+            return 0
+
         # Se já é int, retorna diretamente
         if isinstance(valor, int):
             return valor
 
-        # Se é float, converte para int
+        # Se é float, converte para int (isfinite cobre NaN e ±inf em uma
+        # chamada C, sem construir floats de comparação)
         elif isinstance(valor, float):
-            if valor != valor:  # Checa se é NaN
-                return padrao
-            if valor == float("inf") or valor == float("-inf"):
+            if not math.isfinite(valor):
                 return padrao
             return int(valor)
 
@@ -314,10 +433,11 @@ def safe_int(valor: Any, padrao: int = 0) -> int:
                         return padrao
                     return int(float_val)
                 except ValueError:
-                    # Se ainda falhar, extrai apenas números da string
-                    numeros_na_string = re.findall(r"-?\d+", valor_limpo)
-                    if numeros_na_string:
-                        return int(numeros_na_string[0])
+                    # Se ainda falhar, extrai o primeiro número da string
+                    # (search para em vez de materializar todos como findall)
+                    match = _PADRAO_INTEIROS.search(valor_limpo)
+                    if match:
+                        return int(match.group())
                     return padrao
 
         # Para outros tipos, tenta conversão direta
@@ -325,13 +445,44 @@ def safe_int(valor: Any, padrao: int = 0) -> int:
             return int(valor)
 
     except (ValueError, TypeError, OverflowError) as e:
-        logger = obter_logger("utils")
-        logger.debug(
-            f"safe_int: Erro ao converter '{valor}' (tipo: {type(valor)}) para int: {e}. Usando padrão: {padrao}"
+        _LOGGER.debug(
+            "safe_int: Erro ao converter '%s' (tipo: %s) para int: %s. "
+            "Usando padrão: %s",
+            valor,
+            type(valor),
+            e,
+            padrao,
         )
         return padrao
 
 
+@lru_cache(maxsize=4096)
+def _normalizar_numero_str(valor_str: str) -> str:
+    """
+    Normaliza a string já convertida; memoizado para códigos repetidos.
+
+    O resultado é internado (sys.intern): grafias distintas do mesmo
+    código ('i5', 'I5', 'I05') devolvem o mesmo objeto, então comparações
+    posteriores de iguais resolvem no ponteiro e cada código distinto
+    ocupa uma única cópia em memória.
+    """
+    # Uma única varredura separa letras e números; a validação alfanumérica
+    # (1-3 letras + 1-4 dígitos) vira duas comparações de tamanho, em vez
+    # de validar e separar em passadas distintas sobre a mesma string
+    codigo_str = valor_str.strip().upper()
+    partes = _separar_letras_digitos(codigo_str)
+    if partes:
+        letras, numeros = partes
+        if len(letras) <= 3 and len(numeros) <= 4:
+            # Mesmo padding de normalizar_codigo_alfanumerico (I5 -> I05)
+            if len(letras) == 1 and len(numeros) <= 2:
+                return sys.intern(f"{letras}{numeros.zfill(2)}")
+            return sys.intern(codigo_str)
+
+    # Senão, aplica formatação padrão (codigo_str já está canônica)
+    return sys.intern(_somente_alfanum(codigo_str))
+
+
 def normalizar_tipo_numero_loja(valor: Any) -> str:
     """
     CORREÇÃO CRÍTICA: Normaliza qualquer tipo de entrada para string.
@@ -345,6 +496,11 @@ def normalizar_tipo_numero_loja(valor: Any) -> str:
     if valor is None:
         return ""
 
+    # Caminho rápido para inteiros não negativos (células numéricas): o
+    # str(int) já é a forma normalizada, sem varredura nem memoização
+    if type(valor) is int and valor >= 0:
+        return str(valor)
+
     try:
         # Se for um número (int ou float), converte para string
         if isinstance(valor, (int, float)):
@@ -362,17 +518,12 @@ def normalizar_tipo_numero_loja(valor: Any) -> str:
             # Se for string ou outro tipo, converte para string
             valor_str = str(valor)
 
-        # Primeiro tenta normalização de código alfanumérico
-        if validar_codigo_alfanumerico(valor_str):
-            return normalizar_codigo_alfanumerico(valor_str)
-
-        # Senão, aplica formatação padrão
-        return formatar_numero_loja(valor_str)
+        # Normalização da string memoizada (colunas repetem muitos códigos)
+        return _normalizar_numero_str(valor_str)
 
     except Exception as e:
-        logger = obter_logger("utils")
-        logger.warning(
-            f"normalizar_tipo_numero_loja: Erro ao normalizar '{valor}': {e}"
+        _LOGGER.warning(
+            "normalizar_tipo_numero_loja: Erro ao normalizar '%s': %s", valor, e
         )
         return ""
 
@@ -389,6 +540,23 @@ def comparar_numeros_loja(numero1: Any, numero2: Any) -> bool:
         bool: True se são iguais, False caso contrário.
     """
     try:
+        # Atalho: entradas idênticas (o caso comum ao comparar chaves de
+        # planilha) dispensam toda a normalização com regex
+        if numero1 is numero2:
+            return True
+        if (
+            type(numero1) is type(numero2)
+            and isinstance(numero1, int)
+            and numero1 == numero2
+        ):
+            return True
+        if (
+            isinstance(numero1, str)
+            and isinstance(numero2, str)
+            and numero1.strip().upper() == numero2.strip().upper()
+        ):
+            return True
+
         # Normaliza ambos os valores para string
         num1_normalizado = normalizar_tipo_numero_loja(numero1)
         num2_normalizado = normalizar_tipo_numero_loja(numero2)
@@ -405,18 +573,28 @@ def comparar_numeros_loja(numero1: Any, numero2: Any) -> bool:
             # Compara sem padding de zeros (I5 == I05)
             resultado = comparar_codigos_flexivel(num1_normalizado, num2_normalizado)
 
-        # Log para debug
-        logger = obter_logger("utils")
-        logger.debug(
-            f"comparar_numeros_loja: '{numero1}' ({type(numero1)}) com '{numero2}' ({type(numero2)}) -> '{num1_normalizado}' == '{num2_normalizado}' = {resultado}"
-        )
+        # Log para debug (formatação adiada: só paga se DEBUG estiver ativo)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "comparar_numeros_loja: '%s' (%s) com '%s' (%s) -> "
+                "'%s' == '%s' = %s",
+                numero1,
+                type(numero1),
+                numero2,
+                type(numero2),
+                num1_normalizado,
+                num2_normalizado,
+                resultado,
+            )
 
         return resultado
 
     except Exception as e:
-        logger = obter_logger("utils")
-        logger.error(
-            f"comparar_numeros_loja: Erro ao comparar '{numero1}' e '{numero2}': {e}"
+        _LOGGER.error(
+            "comparar_numeros_loja: Erro ao comparar '%s' e '%s': %s",
+            numero1,
+            numero2,
+            e,
         )
         return False
 
@@ -435,12 +613,12 @@ def comparar_codigos_flexivel(codigo1: str, codigo2: str) -> bool:
     """
     try:
         # Extrai letras e números de cada código
-        match1 = re.match(r"^([A-Z]+)([0-9]+)$", codigo1.upper())
-        match2 = re.match(r"^([A-Z]+)([0-9]+)$", codigo2.upper())
+        partes1 = _separar_letras_digitos(codigo1.upper())
+        partes2 = _separar_letras_digitos(codigo2.upper())
 
-        if match1 and match2:
-            letras1, numeros1 = match1.groups()
-            letras2, numeros2 = match2.groups()
+        if partes1 and partes2:
+            letras1, numeros1 = partes1
+            letras2, numeros2 = partes2
 
             # Compara letras e números como inteiros (remove zeros à esquerda)
             return letras1 == letras2 and int(numeros1) == int(numeros2)
@@ -448,9 +626,11 @@ def comparar_codigos_flexivel(codigo1: str, codigo2: str) -> bool:
         return False
 
     except Exception as e:
-        logger = obter_logger("utils")
-        logger.debug(
-            f"comparar_codigos_flexivel: Erro na comparação de '{codigo1}' e '{codigo2}': {e}"
+        _LOGGER.debug(
+            "comparar_codigos_flexivel: Erro na comparação de '%s' e '%s': %s",
+            codigo1,
+            codigo2,
+            e,
         )
         return False
 
@@ -469,18 +649,23 @@ def formatar_lista_lojas(lista_str: str) -> list:
         return []
 
     try:
-        # Separa por vírgula e formata cada item
-        numeros = []
-        for item in lista_str.split(","):
-            numero_formatado = normalizar_tipo_numero_loja(item.strip())
-            if numero_formatado and validar_numero_loja(numero_formatado):
-                numeros.append(numero_formatado)
-
-        return numeros
+        # Um único split em C por vírgulas/espaços e uma comprehension com o
+        # normalizador ligado a um nome local. A validação extra era
+        # redundante: o normalizador só devolve string alfanumérica ou vazia
+        normalizar = normalizar_tipo_numero_loja
+        return [
+            numero
+            for numero in (
+                normalizar(item)
+                for item in _PADRAO_SEPARADORES.split(lista_str.strip())
+            )
+            if numero
+        ]
 
     except Exception as e:
-        logger = obter_logger("utils")
-        logger.error(f"formatar_lista_lojas: Erro ao formatar lista '{lista_str}': {e}")
+        _LOGGER.error(
+            "formatar_lista_lojas: Erro ao formatar lista '%s': %s", lista_str, e
+        )
         return []
 
 
@@ -497,8 +682,8 @@ def validar_configuracao_coluna(coluna: str) -> bool:
     if not coluna or not isinstance(coluna, str):
         return False
 
-    # Verifica se é uma letra válida de coluna
-    return bool(re.match(r"^[A-Z]+$", coluna.upper()))
+    # Verifica se é uma letra válida de coluna (ASCII alfabético, sem regex)
+    return coluna.isascii() and coluna.isalpha()
 
 
 def truncar_texto(texto: str, max_length: int = 100) -> str:
@@ -529,22 +714,35 @@ def debug_tipo_valor(valor: Any, nome_variavel: str = "valor") -> None:
         valor: Valor para análise.
         nome_variavel (str): Nome da variável para log.
     """
-    logger = obter_logger("utils")
-    logger.debug(
-        f"DEBUG {nome_variavel}: valor='{valor}', tipo={type(valor)}, repr={repr(valor)}"
-    )
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "DEBUG %s: valor='%s', tipo=%s, repr=%r",
+            nome_variavel,
+            valor,
+            type(valor),
+            valor,
+        )
 
 
-def listar_formatos_suportados() -> dict:
+# Construído uma vez no import e exposto como visão imutável: zero alocação
+# por chamada e sem risco de mutação acidental do cache
+_FORMATOS_SUPORTADOS = MappingProxyType(
+    {
+        "numericos": ("123", "456", "789", "1000"),
+        "alfanumericos_padrao": ("I05", "T09", "I01", "A99"),
+        "alfanumericos_multiplas_letras": ("AB12", "XYZ999"),
+        "variacao_aceita": MappingProxyType(
+            {"I5": "I05", "T9": "T09", "i01": "I01", "t09": "T09"}
+        ),
+    }
+)
+
+
+def listar_formatos_suportados() -> Mapping:
     """
     Retorna uma lista dos formatos de código de loja suportados.
 
     Returns:
-        dict: Dicionário com exemplos de formatos suportados.
+        Mapping: Dicionário (somente leitura) com exemplos de formatos.
     """
-    return {
-        "numericos": ["123", "456", "789", "1000"],
-        "alfanumericos_padrao": ["I05", "T09", "I01", "A99"],
-        "alfanumericos_multiplas_letras": ["AB12", "XYZ999"],
-        "variacao_aceita": {"I5": "I05", "T9": "T09", "i01": "I01", "t09": "T09"},
-    }
+    return _FORMATOS_SUPORTADOS